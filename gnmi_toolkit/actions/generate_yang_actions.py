@@ -2,16 +2,110 @@
 """Generate StackStorm Actions from Parsed YANG Models"""
 from st2common.runners.base_action import Action
 import os
+import re
+import base64
+import gzip
+import stat
 import sys
 import json
+import pickle
 import time
 import subprocess
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+
+# orjson decodes large JSON payloads ~2-5x faster than stdlib json and
+# accepts bytes directly; fall back to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decode failures from either JSON backend - deliberately narrower than
+# ValueError so unrelated errors reach the generic handler in run()
+if orjson is not None:
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError)
+else:
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+# In-process StackStorm API client - each 'st2 run' subprocess pays 1-3s of
+# fork/exec/CLI-import/auth overhead before any real work; the API client
+# skips all of that. Fall back to the CLI when st2client isn't importable.
+try:
+    from st2client.client import Client
+    from st2client.models import LiveAction
+except ImportError:
+    Client = None
+    LiveAction = None
 
 # Add lib to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "lib"))
-from pack_utils import generate_pack_name, get_pack_base_dir
+from pack_utils import generate_pack_name, get_pack_base_dir, get_cache_dir
 from container_grouper import ContainerGrouper
-from action_generator import ActionGenerator
+from action_generator import ActionGenerator, _utc_timestamp
+
+
+def _json_loads(payload):
+    """Decode a datastore JSON payload with orjson when available
+
+    Large payloads are stored by the parse action as 'gz:' +
+    base64(gzip(json)); plain JSON can never start with that prefix,
+    so sniffing it here keeps both formats transparent to callers
+    (including the sidecar schema cache, which stores payloads as
+    fetched).
+    """
+    if isinstance(payload, str) and payload.startswith("gz:"):
+        payload = gzip.decompress(base64.b64decode(payload[3:]))
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# Local cache of decoded datastore payloads, keyed by the version stamp the
+# parser stores alongside them - repeated generation runs skip the datastore
+# RPC + JSON decode entirely when the schema hasn't changed. Lives under
+# the per-user cache root (see pack_utils.get_cache_dir); never /tmp,
+# where planted pickles could execute as the action user
+
+# Parses the registered-action count from 'st2 run packs.load' CLI output
+# (fallback path only - the API path reads the result dict directly)
+_ACTION_COUNT_RE = re.compile(r"actions:\s*(\d+)")
+
+# C-level field projection for the result summary (see run())
+_SUMMARY_FIELDS = itemgetter("action_name", "module", "container", "param_count")
+_SUMMARY_KEYS = ("name", "module", "container", "params")
+
+# Per-process ActionGenerator for pool workers, built once by the pool
+# initializer so each worker compiles the templates a single time
+_worker_generator = None
+_worker_timestamp = None
+
+
+def _init_generation_worker(template_dir, output_dir, timestamp):
+    """Pool initializer: build this worker's ActionGenerator"""
+    global _worker_generator, _worker_timestamp
+    _worker_generator = ActionGenerator(template_dir, output_dir)
+    _worker_timestamp = timestamp
+
+
+def _run_generation_task(generator, task, timestamp):
+    """Render the action files for one (module, container) task"""
+    device_name, module_name, container_path, container_data, pack_name = task
+    return generator.generate_action_for_container(
+        device_name=device_name,
+        module_name=module_name,
+        container_path=container_path,
+        container_data=container_data,
+        pack_name=pack_name,
+        timestamp=timestamp,
+    )
+
+
+def _generate_one(task):
+    """Pool entry point - uses the per-process generator"""
+    return _run_generation_task(_worker_generator, task, _worker_timestamp)
 
 
 class YangGenerateActionsAction(Action):
@@ -54,14 +148,12 @@ class YangGenerateActionsAction(Action):
         self.logger.info(f"Target pack: {output_pack}")
 
         try:
-            # Load parsed YANG data from datastore
+            # Load parsed YANG data from datastore (or the local cache when
+            # the parser's version stamp matches)
             self.logger.info("Loading YANG schema from datastore...")
-            key = f"gnmi_toolkit.YangParseModelsAction:device:{device_name}:yang_paths"
-            schema_json = self.action_service.get_value(
-                name=key, local=False, decrypt=False  # Don't add action class prefix
-            )
+            yang_schema, list_registry = self._load_yang_data(device_name)
 
-            if not schema_json:
+            if not yang_schema:
                 return (
                     False,
                     {
@@ -71,17 +163,6 @@ class YangGenerateActionsAction(Action):
                     },
                 )
 
-            yang_schema = json.loads(schema_json)
-
-            # Load list registry from datastore
-            key_lists = (
-                f"gnmi_toolkit.YangParseModelsAction:device:{device_name}:yang_lists"
-            )
-            lists_json = self.action_service.get_value(
-                name=key_lists, local=False, decrypt=False
-            )
-            list_registry = json.loads(lists_json) if lists_json else {}
-
             if list_registry:
                 total_lists = sum(len(lists) for lists in list_registry.values())
                 self.logger.info(
@@ -90,6 +171,9 @@ class YangGenerateActionsAction(Action):
             else:
                 self.logger.info("No list registry found (lists will be skipped)")
 
+            # Note: lazy/on-demand JSON parsing (simdjson) was evaluated for
+            # this summary, but ContainerGrouper consumes the whole schema
+            # dict right below, so the DOM has to be materialized regardless
             total_modules = len(yang_schema)
             total_paths = sum(data["path_count"] for data in yang_schema.values())
 
@@ -107,65 +191,82 @@ class YangGenerateActionsAction(Action):
 
             self.logger.info(f"Output directory: {output_dir}")
 
+            # Kick off virtualenv setup in the background - it's a pip
+            # install (up to minutes) that only needs requirements.txt, which
+            # _ensure_pack_structure just wrote; it is independent of the
+            # rendering loop but MUST finish before registration
+            venv_executor = None
+            venv_future = None
+            if setup_virtualenv:
+                venv_executor = ThreadPoolExecutor(max_workers=1)
+                venv_future = venv_executor.submit(
+                    self._setup_virtualenv, output_pack, pack_base_dir
+                )
+
             # Group paths by container
             self.logger.info("Grouping paths into containers...")
             grouper = ContainerGrouper(yang_schema, list_registry)
-            grouped = grouper.group_by_container(min_params=1)
 
-            summary = grouper.get_container_summary(grouped)
+            # Flatten the container stream into one lazy iterator - every
+            # container renders to its own pair of files, so generation is
+            # embarrassingly parallel and islice applies the max_actions
+            # limit (0 means unlimited) without per-iteration limit checks
+            if max_actions > 0:
+                # Truncated run (common during iterative development):
+                # iter_containers groups module-by-module, so only the
+                # modules needed to reach the limit are grouped at all -
+                # O(max_actions), not O(total_containers)
+                flat = (
+                    (action_prefix, module_name, container_path,
+                     container_data, output_pack)
+                    for module_name, container_path, container_data
+                    in grouper.iter_containers(min_params=1)
+                )
+                tasks = list(islice(flat, max_actions))
+                if len(tasks) == max_actions:
+                    self.logger.info(f"Reached max_actions limit: {max_actions}")
+
+                summary = self._summarize_tasks(tasks)
+            else:
+                grouped = grouper.group_by_container(min_params=1)
+                summary = grouper.get_container_summary(grouped)
+
+                tasks = [
+                    (action_prefix, module_name, container_path,
+                     container_data, output_pack)
+                    for module_name, containers in grouped.items()
+                    for container_path, container_data in containers.items()
+                ]
+
+            # Bind the summary fields once - reused by the log line and the
+            # result dict below, and %s formatting keeps the log lazy
+            total_modules_found = summary["total_modules"]
+            total_containers_found = summary["total_containers"]
             self.logger.info(
-                f"Found {summary['total_containers']} containers "
-                f"({summary['config_containers']} config, {summary['state_containers']} state) "
-                f"in {summary['total_modules']} modules"
+                "Found %s containers (%s config, %s state) in %s modules",
+                total_containers_found,
+                summary["config_containers"],
+                summary["state_containers"],
+                total_modules_found,
             )
 
-            # Initialize generator
-            generator = ActionGenerator(template_dir, output_dir)
-
             # Generate actions
             self.logger.info("Generating actions...")
-            generated_actions = []
-            action_count = 0
-
-            for module_name, containers in grouped.items():
-                for container_path, container_data in containers.items():
-                    # Check max actions limit (0 means unlimited)
-                    if max_actions > 0 and action_count >= max_actions:
-                        self.logger.info(f"Reached max_actions limit: {max_actions}")
-                        break
-
-                    # Generate action
-                    result = generator.generate_action_for_container(
-                        device_name=action_prefix,
-                        module_name=module_name,
-                        container_path=container_path,
-                        container_data=container_data,
-                        pack_name=output_pack,
-                    )
-
-                    if result and result["success"]:
-                        generated_actions.append(result)
-                        action_count += 1
-
-                        # Log progress every 10 actions
-                        if action_count % 10 == 0:
-                            self.logger.info(f"Generated {action_count} actions...")
-
-                # Break outer loop if limit reached
-                if max_actions > 0 and action_count >= max_actions:
-                    self.logger.info(f"Reached max_actions limit: {max_actions}")
-                    break
+            action_count, first_actions = self._generate_actions(
+                tasks, template_dir, output_dir
+            )
 
             generation_time = time.time() - start_time
             self.logger.info(
-                f"Generation complete: {len(generated_actions)} actions "
+                f"Generation complete: {action_count} actions "
                 f"in {generation_time:.2f}s"
             )
 
-            # Setup virtual environment (MUST come before registration)
+            # Collect virtualenv setup result (MUST come before registration)
             venv_result = {"success": True, "skipped": True}
-            if setup_virtualenv:
-                venv_result = self._setup_virtualenv(output_pack, pack_base_dir)
+            if venv_future is not None:
+                venv_result = venv_future.result()
+                venv_executor.shutdown()
 
                 if not venv_result["success"] and not venv_result["skipped"]:
                     self.logger.warning(
@@ -175,7 +276,7 @@ class YangGenerateActionsAction(Action):
 
             # Register actions with StackStorm (comes AFTER virtualenv)
             registration_result = {"success": True, "action_count": 0}
-            if register_actions and generated_actions:
+            if register_actions and action_count:
                 registration_result = self._register_pack(output_pack)
 
                 if not registration_result["success"]:
@@ -193,18 +294,13 @@ class YangGenerateActionsAction(Action):
                     "success": True,
                     "device_name": device_name,
                     "pack_name": output_pack,
-                    "generated_count": len(generated_actions),
+                    "generated_count": action_count,
                     "actions": [
-                        {
-                            "name": a["action_name"],
-                            "module": a["module"],
-                            "container": a["container"],
-                            "params": a["param_count"],
-                        }
-                        for a in generated_actions[:20]  # First 20 for output
+                        dict(zip(_SUMMARY_KEYS, _SUMMARY_FIELDS(a)))
+                        for a in first_actions  # First 20 for output
                     ],
-                    "total_modules": summary["total_modules"],
-                    "total_containers": summary["total_containers"],
+                    "total_modules": total_modules_found,
+                    "total_containers": total_containers_found,
                     "generation_time_seconds": round(generation_time, 2),
                     "total_time_seconds": round(total_time, 2),
                     # Virtualenv info
@@ -218,7 +314,7 @@ class YangGenerateActionsAction(Action):
                 },
             )
 
-        except json.JSONDecodeError as e:
+        except _JSON_DECODE_ERRORS as e:
             self.logger.error("Failed to parse YANG schema from datastore")
             return (
                 False,
@@ -230,20 +326,168 @@ class YangGenerateActionsAction(Action):
             )
 
         except Exception as e:
-            self.logger.error("Action generation failed")
-            self.logger.error(f"Error: {str(e)}")
-            import traceback
-
-            self.logger.error(traceback.format_exc())
+            # Format the traceback once and reuse it for both the log and
+            # the result; %s args keep interpolation lazy for the logger
+            tb_str = traceback.format_exc()
+            self.logger.error("Action generation failed: %s\n%s", e, tb_str)
             return (
                 False,
                 {
                     "success": False,
                     "error": str(e),
-                    "traceback": traceback.format_exc(),
+                    "traceback": tb_str,
                 },
             )
 
+    def _summarize_tasks(self, tasks):
+        """Build the container summary for a truncated (max_actions) run"""
+        config_containers = sum(
+            1 for task in tasks if task[3].is_writable
+        )
+        return {
+            "total_modules": len({task[1] for task in tasks}),
+            "total_containers": len(tasks),
+            "config_containers": config_containers,
+            "state_containers": len(tasks) - config_containers,
+        }
+
+    # Container count above which generation fans out to a process pool
+    # (Jinja rendering + file writes are CPU-bound and scale with cores)
+    GENERATION_PROCESS_THRESHOLD = 50
+
+    def _generate_actions(self, tasks, template_dir, output_dir):
+        """
+        Render action files for every task, in parallel for large packs
+
+        Small packs stay on the serial path to avoid process startup cost;
+        larger ones distribute containers across a ProcessPoolExecutor where
+        each worker compiles the templates once and writes disjoint files.
+
+        Only the first 20 result dicts are retained (all the caller reports);
+        the rest are counted and dropped so memory stays O(20) instead of
+        O(total actions).
+
+        Returns:
+            tuple: (action_count, first_actions) - first_actions holds at
+                   most the first 20 successful results
+        """
+        action_count = 0
+        first_actions = []
+
+        # One shared timestamp for the whole batch - every generated file
+        # in a run carries the same header instead of paying a clock read
+        # and strftime per container
+        timestamp = _utc_timestamp()
+
+        if len(tasks) >= self.GENERATION_PROCESS_THRESHOLD:
+            with ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_generation_worker,
+                initargs=(template_dir, output_dir, timestamp),
+            ) as executor:
+                for result in executor.map(_generate_one, tasks, chunksize=16):
+                    if result and result["success"]:
+                        action_count += 1
+                        if len(first_actions) < 20:
+                            first_actions.append(result)
+
+                        # Log progress every 10 actions
+                        if action_count % 10 == 0:
+                            self.logger.info(
+                                f"Generated {action_count} actions..."
+                            )
+        else:
+            generator = ActionGenerator(template_dir, output_dir)
+            for task in tasks:
+                result = _run_generation_task(generator, task, timestamp)
+
+                if result and result["success"]:
+                    action_count += 1
+                    if len(first_actions) < 20:
+                        first_actions.append(result)
+
+                    # Log progress every 10 actions
+                    if action_count % 10 == 0:
+                        self.logger.info(
+                            f"Generated {action_count} actions..."
+                        )
+
+        return action_count, first_actions
+
+    def _load_yang_data(self, device_name):
+        """
+        Load parsed schema and list registry for a device
+
+        The parser stores a content-hash version stamp next to the payloads;
+        when it matches the local sidecar cache, the decoded data is restored
+        with a single unpickle instead of a datastore RPC + JSON decode.
+
+        Returns:
+            tuple: (yang_schema, list_registry) - ({}, {}) if nothing stored
+        """
+        key_prefix = f"gnmi_toolkit.YangParseModelsAction:device:{device_name}"
+
+        version = self.action_service.get_value(
+            name=f"{key_prefix}:yang_paths_version", local=False, decrypt=False
+        )
+
+        cache_dir = get_cache_dir()
+        cache_base = (
+            os.path.join(cache_dir, device_name.replace(os.sep, "_"))
+            if cache_dir is not None
+            else None
+        )
+
+        # Cache hit: version stamp matches what we decoded last time
+        if version and cache_base is not None:
+            try:
+                with open(cache_base + ".version") as f:
+                    cached_version = f.read()
+                if cached_version == version:
+                    with open(cache_base + ".pkl", "rb") as f:
+                        yang_schema, list_registry = pickle.load(f)
+                    self.logger.info("Schema cache hit (version %s)" % version[:12])
+                    return yang_schema, list_registry
+            except (OSError, pickle.PickleError, EOFError, ValueError):
+                pass  # Missing/corrupt cache - fall through to the datastore
+
+        # Issue both datastore RPCs concurrently - each is a synchronous
+        # 10-50ms round trip and they are independent
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            schema_future = executor.submit(
+                self.action_service.get_value,
+                name=f"{key_prefix}:yang_paths",
+                local=False,  # Don't add action class prefix
+                decrypt=False,
+            )
+            lists_future = executor.submit(
+                self.action_service.get_value,
+                name=f"{key_prefix}:yang_lists",
+                local=False,
+                decrypt=False,
+            )
+            schema_json = schema_future.result()
+            lists_json = lists_future.result()
+
+        if not schema_json:
+            return {}, {}
+
+        yang_schema = _json_loads(schema_json)
+        list_registry = _json_loads(lists_json) if lists_json else {}
+
+        # Refresh the sidecar cache (atomic: payload first, stamp last)
+        if version and cache_base is not None:
+            try:
+                with open(cache_base + ".pkl", "wb") as f:
+                    pickle.dump((yang_schema, list_registry), f, protocol=5)
+                with open(cache_base + ".version.tmp", "w") as f:
+                    f.write(version)
+                os.replace(cache_base + ".version.tmp", cache_base + ".version")
+            except OSError as e:
+                self.logger.warning(f"Could not write schema cache: {e}")
+
+        return yang_schema, list_registry
+
     def _ensure_pack_structure(self, pack_dir, pack_name, device_name):
         """
         Ensure device pack has proper structure
@@ -257,47 +501,60 @@ class YangGenerateActionsAction(Action):
         os.makedirs(os.path.join(pack_dir, "actions", "generated"), exist_ok=True)
 
         # Create pack.yaml if it doesn't exist
+        # Single literal (no list + join pass), created with O_EXCL so the
+        # existence check and the create are one syscall instead of
+        # stat + open
         pack_yaml_path = os.path.join(pack_dir, "pack.yaml")
-        if not os.path.exists(pack_yaml_path):
-            # Build pack.yaml content with proper indentation
-            pack_yaml_content = [
-                "---",
-                f"name: {pack_name}",
-                f'description: "Auto-generated pack for device {device_name}"',
-                'version: "0.1.0"',
-                'author: "gnmi_toolkit"',
-                'email: "admin@example.com"',
-                "keywords:",
-                "  - network",
-                "  - gnmi",
-                "  - yang",
-                "  - device",
-                "",  # Trailing newline
-            ]
-
-            with open(pack_yaml_path, "w") as f:
-                f.write("\n".join(pack_yaml_content))
-
+        pack_yaml = (
+            "---\n"
+            f"name: {pack_name}\n"
+            f'description: "Auto-generated pack for device {device_name}"\n'
+            'version: "0.1.0"\n'
+            'author: "gnmi_toolkit"\n'
+            'email: "admin@example.com"\n'
+            "keywords:\n"
+            "  - network\n"
+            "  - gnmi\n"
+            "  - yang\n"
+            "  - device\n"
+        )
+
+        if self._create_if_missing(pack_yaml_path, pack_yaml):
             self.logger.info(f"Created pack.yaml for {pack_name}")
 
         # Create requirements.txt if it doesn't exist
         requirements_path = os.path.join(pack_dir, "requirements.txt")
-        if not os.path.exists(requirements_path):
-            requirements_content = [
-                f"# Auto-generated requirements for pack: {pack_name}",
-                "ncclient",
-                "pygnmi",
-                "jinja2",
-                "",  # Trailing newline
-            ]
-
-            with open(requirements_path, "w") as f:
-                f.write("\n".join(requirements_content))
-
+        requirements = (
+            f"# Auto-generated requirements for pack: {pack_name}\n"
+            "ncclient\n"
+            "pygnmi\n"
+            "jinja2\n"
+        )
+
+        if self._create_if_missing(requirements_path, requirements):
             self.logger.info(f"Created requirements.txt for {pack_name}")
         else:
             self.logger.info(f"requirements.txt already exists for {pack_name}")
 
+    def _create_if_missing(self, filepath, content):
+        """
+        Create a file with one exclusive open + write, unless it exists
+
+        Returns:
+            bool: True if the file was created, False if it already existed
+        """
+        try:
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return False
+
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+        return True
+
     def _setup_virtualenv(self, pack_name, pack_dir):
         """
         Setup virtual environment using StackStorm's packs.setup_virtualenv action
@@ -316,8 +573,10 @@ class YangGenerateActionsAction(Action):
         venv_path = f"/opt/stackstorm/virtualenvs/{pack_name}"
         requirements_path = os.path.join(pack_dir, "requirements.txt")
 
-        # Check if requirements.txt exists
-        if not os.path.exists(requirements_path):
+        # Check if requirements.txt exists (single stat, not exists())
+        try:
+            os.stat(requirements_path)
+        except FileNotFoundError:
             self.logger.warning(
                 f"No requirements.txt found for {pack_name}. "
                 "Skipping virtualenv setup."
@@ -328,8 +587,14 @@ class YangGenerateActionsAction(Action):
                 "skipped": True,
             }
 
-        # Check if virtualenv already exists
-        if os.path.exists(venv_path) and os.path.isdir(venv_path):
+        # Check if virtualenv already exists - one stat instead of the
+        # exists() + isdir() pair (two round trips on cold NFS inodes)
+        try:
+            venv_exists = stat.S_ISDIR(os.stat(venv_path).st_mode)
+        except FileNotFoundError:
+            venv_exists = False
+
+        if venv_exists:
             self.logger.info(
                 f"Virtual environment already exists for {pack_name}"
             )
@@ -343,8 +608,47 @@ class YangGenerateActionsAction(Action):
         self.logger.info(f"Setting up virtual environment for {pack_name}...")
         self.logger.info("This may take 1-2 minutes to install dependencies...")
 
+        if Client is not None:
+            try:
+                succeeded, result = self._run_st2_action(
+                    "packs.setup_virtualenv", {"packs": [pack_name]}, timeout=300
+                )
+
+                if succeeded:
+                    self.logger.info(
+                        f"Virtual environment created successfully for {pack_name}"
+                    )
+                    return {
+                        "success": True,
+                        "message": "Virtual environment created successfully",
+                        "skipped": False,
+                    }
+
+                error_msg = str(result)
+                self.logger.error(f"Virtualenv setup failed: {error_msg}")
+                return {
+                    "success": False,
+                    "message": f"Setup failed: {error_msg}",
+                    "skipped": False,
+                }
+
+            except TimeoutError:
+                self.logger.error("Virtualenv setup timed out")
+                return {
+                    "success": False,
+                    "message": "Setup timed out after 5 minutes",
+                    "skipped": False,
+                }
+            except Exception as e:
+                self.logger.error(f"Virtualenv setup error: {str(e)}")
+                return {
+                    "success": False,
+                    "message": f"Exception: {str(e)}",
+                    "skipped": False,
+                }
+
         try:
-            # Use st2 run to execute packs.setup_virtualenv action
+            # st2client unavailable - fall back to the CLI
             result = subprocess.run(
                 ["st2", "run", "packs.setup_virtualenv", f"packs={pack_name}"],
                 capture_output=True,
@@ -385,6 +689,41 @@ class YangGenerateActionsAction(Action):
                 "skipped": False,
             }
 
+    # Execution statuses that mean an st2 action run is finished
+    _TERMINAL_STATUSES = ("succeeded", "failed", "timeout", "abandoned", "canceled")
+
+    def _run_st2_action(self, action_ref, parameters, timeout):
+        """
+        Run a StackStorm action via the in-process API and wait for it
+
+        Args:
+            action_ref: Action reference (e.g., 'packs.setup_virtualenv')
+            parameters: Action parameters dict
+            timeout: Seconds to wait for completion
+
+        Returns:
+            tuple: (succeeded, result) - result is the execution result dict
+
+        Raises:
+            TimeoutError: If the execution doesn't finish within timeout
+        """
+        client = Client()
+        execution = client.executions.create(
+            LiveAction(action=action_ref, parameters=parameters)
+        )
+
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            execution = client.executions.get_by_id(execution.id)
+            if execution.status in self._TERMINAL_STATUSES:
+                return (
+                    execution.status == "succeeded",
+                    getattr(execution, "result", None),
+                )
+            time.sleep(1)
+
+        raise TimeoutError(f"{action_ref} did not finish within {timeout}s")
+
     def _register_pack(self, pack_name):
         """
         Register pack actions using StackStorm's packs.load action
@@ -397,8 +736,59 @@ class YangGenerateActionsAction(Action):
         """
         self.logger.info(f"Registering actions for pack: {pack_name}")
 
+        if Client is not None:
+            try:
+                succeeded, result = self._run_st2_action(
+                    "packs.load",
+                    {"packs": [pack_name], "register": "actions"},
+                    timeout=60,
+                )
+
+                if succeeded:
+                    self.logger.info(
+                        f"Actions registered successfully for {pack_name}"
+                    )
+
+                    # packs.load returns the per-resource registration counts
+                    # as a dict - no stdout scraping needed
+                    action_count = 0
+                    if isinstance(result, dict):
+                        try:
+                            action_count = int(result.get("actions", 0))
+                        except (TypeError, ValueError):
+                            action_count = 0
+
+                    return {
+                        "success": True,
+                        "message": "Actions registered successfully",
+                        "action_count": action_count,
+                    }
+
+                error_msg = str(result)
+                self.logger.error(f"Registration failed: {error_msg}")
+                return {
+                    "success": False,
+                    "message": f"Registration failed: {error_msg}",
+                    "action_count": 0,
+                }
+
+            except TimeoutError:
+                self.logger.error("Registration timed out")
+                return {
+                    "success": False,
+                    "message": "Registration timed out after 60 seconds",
+                    "action_count": 0,
+                }
+            except Exception as e:
+                self.logger.error(f"Registration error: {str(e)}")
+                return {
+                    "success": False,
+                    "message": f"Exception: {str(e)}",
+                    "action_count": 0,
+                }
+
         try:
-            # Use packs.load with register=actions for granular control
+            # st2client unavailable - fall back to the CLI
             result = subprocess.run(
                 ["st2", "run", "packs.load", f"packs={pack_name}", "register=actions"],
                 capture_output=True,
@@ -410,17 +800,11 @@ class YangGenerateActionsAction(Action):
                 self.logger.info(f"Actions registered successfully for {pack_name}")
 
                 # Try to parse action count from output
+                # Output format: "actions: 13"
                 action_count = 0
-                if "actions:" in result.stdout:
-                    try:
-                        # Output format: "actions: 13"
-                        import re
-
-                        match = re.search(r"actions:\s*(\d+)", result.stdout)
-                        if match:
-                            action_count = int(match.group(1))
-                    except:
-                        pass
+                match = _ACTION_COUNT_RE.search(result.stdout)
+                if match:
+                    action_count = int(match.group(1))
 
                 return {
                     "success": True,
@@ -3,12 +3,221 @@
 Action Generator - Generate StackStorm actions from YANG containers
 Renders Jinja2 templates and writes action files to device packs
 """
+import hashlib
 import os
 import re
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from jinja2 import Environment, FileSystemLoader, Template
 from type_mapper import TypeMapper
 
+# Action-name sanitizers, built once at import - _build_action_name runs
+# per container, so the per-call cost adds up on large packs.
+# The identifier cleanup is a plain "keep [A-Za-z0-9_]" rule, so a
+# str.translate table (C-level per-char lookup, no regex VM) beats re.sub;
+# YANG identifiers are ASCII per RFC 7950, so a 256-entry table suffices
+_IDENT_TRANS = {
+    c: "_"
+    for c in range(256)
+    if not (c == 0x5F or 0x30 <= c <= 0x39 or 0x41 <= c <= 0x5A or 0x61 <= c <= 0x7A)
+}
+_MULTI_US_RE = re.compile(r"_+")
+
+# Matches the per-run timestamp comment in generated files; masked out
+# of the skip-unchanged comparison in _write_file, since it differs on
+# every run by construction
+_GENERATED_LINE_RE = re.compile(rb"^# Generated: .*$", re.M)
+
+# Hoisted defaults - .get() evaluates its default eagerly, so inline
+# literals would allocate a fresh list/set on every call
+_DEFAULT_OPS = ("get", "update", "replace", "delete")
+
+
+@lru_cache(maxsize=16)
+def _get_env(template_dir):
+    """
+    Shared Jinja environment per template dir
+
+    Callers that build one ActionGenerator per device would otherwise
+    re-lex and re-parse the templates for every instance; caching the
+    Environment (and its compiled-template cache) does that work once
+    per process.
+    """
+    # auto_reload=False skips the per-render template mtime stat and
+    # cache_size=-1 keeps every compiled template for the process life
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
+def _utc_timestamp():
+    """Current UTC time as an ISO-8601 'Z' string for generated headers"""
+    return (
+        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    )
+
+
+# Reserved parameter names from python-script runner
+# These cannot be overridden by action parameters
+_RESERVED_PARAMS = frozenset(
+    {
+        "timeout",  # Action execution timeout
+        "sudo",  # Run with sudo
+        "env",  # Environment variables
+        "cwd",  # Working directory
+        "kwarg_op",  # Keyword argument operator
+    }
+)
+
+# Reserved name -> prefixed replacement, precomputed so the rename is one
+# dict lookup instead of a membership test plus f-string per path
+_RESERVED_MAP = {name: f"yang_{name}" for name in _RESERVED_PARAMS}
+
+
+@lru_cache(maxsize=4096)
+def _split_container(container_path):
+    """Split a container path into its components, cached per path"""
+    return tuple(container_path.strip("/").split("/"))
+
+
+@lru_cache(maxsize=8192)
+def _build_action_name(device_name, module_name, container_path):
+    """
+    Build clean action name following naming conventions
+    Automatically handles long filenames that exceed filesystem limits
+
+    Args:
+    device_name: Device identifier
+    module_name: YANG module name
+    container_path: Container path
+
+    Returns:
+    str: Action name (e.g., 'device_192_168_1_50_openconfig_interfaces_config')
+
+    Examples:
+    ('192.168.1.50', 'openconfig-interfaces', '/interfaces/interface/config')
+    -> 'device_192_168_1_50_openconfig_interfaces_interfaces_interface_config'
+
+    (Very long path with deep nesting)
+    -> 'device_192_168_1_50_openconfig_a1b2c3d4e5f6_config'
+    """
+    # Clean device name
+    clean_device = device_name.replace(".", "_").replace("-", "_")
+
+    # Clean module name (remove version suffix like @2021-01-01)
+    clean_module = module_name.split("@")[0].replace("-", "_")
+
+    # Extract container name from path
+    # '/interfaces/interface/config' -> 'interfaces_interface_config'
+    container_parts = _split_container(container_path)
+    clean_container = "_".join(container_parts)
+
+    # Build full name
+    action_name = f"device_{clean_device}_{clean_module}_{clean_container}"
+
+    # Ensure valid identifier (remove any remaining special chars)
+    action_name = action_name.translate(_IDENT_TRANS)
+
+    # Remove consecutive underscores
+    action_name = _MULTI_US_RE.sub("_", action_name)
+
+    # Handle filesystem filename length limit (255 chars max)
+    # Leave margin for .yaml/.py extension and safety
+    MAX_FILENAME_LENGTH = 200
+
+    if len(action_name) > MAX_FILENAME_LENGTH:
+        # Create short hash of the full name for uniqueness - blake2b with
+        # digest_size=6 yields exactly 12 hex chars and is faster per byte
+        # than MD5 in modern OpenSSL builds
+        hash_part = hashlib.blake2b(action_name.encode(), digest_size=6).hexdigest()
+
+        # Keep the most meaningful parts:
+        # - Device identifier (always keep)
+        # - Module name (abbreviated)
+        # - Hash (for uniqueness)
+        # - Last 2-3 parts of container path (most specific)
+
+        device_prefix = f"device_{clean_device}"
+
+        # Take first word of module name
+        module_short = clean_module.split("_")[0]
+
+        # Take last 2 parts of container path
+        container_suffix = (
+            "_".join(container_parts[-2:])
+            if len(container_parts) >= 2
+            else clean_container
+        )
+
+        # Build shortened name: device_X_module_hash_container_end
+        action_name = (
+            f"{device_prefix}_{module_short}_{hash_part}_{container_suffix}"
+        )
+
+        # Clean any remaining special chars from the shortened name
+        action_name = action_name.translate(_IDENT_TRANS)
+        action_name = _MULTI_US_RE.sub("_", action_name)
+
+        # Final safety check - if still too long, just use hash
+        if len(action_name) > MAX_FILENAME_LENGTH:
+            action_name = f"{device_prefix}_{hash_part}"
+
+    return action_name.lower()
+
+
+@lru_cache(maxsize=8192)
+def _build_class_name(action_name):
+    """
+    Build Python class name from action name (PascalCase)
+
+    Args:
+        action_name: Action name (snake_case)
+
+    Returns:
+        str: Class name (PascalCase)
+
+    Example:
+        'device_192_168_1_50_openconfig_interfaces_config'
+        -> 'Device192168150OpenconfigInterfacesConfig'
+    """
+    # Input is lowercase ASCII (from _build_action_name), so three C-level
+    # string ops replace the per-word Python loop and its allocations
+    return action_name.replace("_", " ").title().replace(" ", "")
+
+
+@lru_cache(maxsize=8192)
+def _build_description(module_name, container_path, is_writable=True):
+    """
+    Build human-readable description for action with operation hint
+
+    Args:
+        module_name: YANG module name
+        container_path: Container path
+        is_writable: Whether container is writable (default: True)
+
+    Returns:
+        str: Description with operation hint
+
+    Examples:
+        (writable=True)  -> "Configure Openconfig Interfaces - Interface Config"
+        (writable=False) -> "Query Openconfig Interfaces - Interface State"
+    """
+    # Try to make it readable
+    module_readable = module_name.replace("-", " ").replace("_", " ").title()
+
+    # Get last part of path for context
+    path_parts = _split_container(container_path)
+    context = " ".join(path_parts[-2:]).replace("-", " ").title()
+
+    # Use appropriate verb based on writability
+    operation_verb = "Configure" if is_writable else "Query"
+
+    return f"{operation_verb} {module_readable} - {context}"
+
 
 class ActionGenerator:
     """Generate StackStorm actions from YANG container groups"""
@@ -28,13 +237,25 @@ class ActionGenerator:
         # Create output directory if needed
         os.makedirs(output_dir, exist_ok=True)
 
-        # Setup Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(template_dir), trim_blocks=True, lstrip_blocks=True
+        # Setup Jinja2 environment (shared across instances per dir)
+        self.jinja_env = _get_env(template_dir)
+
+        # Compile the combined template once up front - it includes the
+        # YAML and Python templates around a sentinel line, so every
+        # container renders with a single template pass over a shared
+        # context instead of two separate render calls
+        self.combined_template = self.jinja_env.get_template(
+            "generated_action.combined.j2"
         )
 
     def generate_action_for_container(
-        self, device_name, module_name, container_path, container_data, pack_name
+        self,
+        device_name,
+        module_name,
+        container_path,
+        container_data,
+        pack_name,
+        timestamp=None,
     ):
         """
         Generate action files (.yaml and .py) for a YANG container
@@ -43,8 +264,10 @@ class ActionGenerator:
             device_name: Device identifier for action naming
             module_name: YANG module name
             container_path: Container path (e.g., '/interfaces/interface/config')
-            container_data: Dict with 'paths' and 'param_count'
+            container_data: ContainerRecord from the grouper
             pack_name: Target StackStorm pack name
+            timestamp: Generation timestamp for file headers; batch callers
+                pass one shared value so it is computed once per run
 
         Returns:
             dict: Generation result
@@ -60,7 +283,7 @@ class ActionGenerator:
         action_name = self._build_action_name(device_name, module_name, container_path)
 
         # Extract list key information if available
-        list_info = container_data.get("list_info", {})
+        list_info = container_data.list_info
         raw_list_keys = list_info.get("keys", [])
 
         # Handle duplicate list key names by renaming them
@@ -72,7 +295,7 @@ class ActionGenerator:
         list_key_names = {key["name"] for key in list_keys_renamed}
 
         # Extract parameters from container paths (excluding list keys)
-        parameters = self._extract_parameters(container_data["paths"], list_key_names)
+        parameters = self._extract_parameters(container_data.paths, list_key_names)
 
         # Skip if no parameters AND no list keys
         # (containers with only list keys should still generate actions)
@@ -81,11 +304,9 @@ class ActionGenerator:
             return None
 
         # Extract container type metadata
-        is_writable = container_data.get("is_writable", True)
-        container_type = container_data.get("container_type", "config")
-        supported_operations = container_data.get(
-            "supported_operations", ["get", "update", "replace", "delete"]
-        )
+        is_writable = container_data.is_writable
+        container_type = container_data.container_type
+        supported_operations = container_data.supported_operations or _DEFAULT_OPS
 
         # Build container description
         description = self._build_description(module_name, container_path, is_writable)
@@ -94,16 +315,12 @@ class ActionGenerator:
         class_name = self._build_class_name(action_name)
 
         # Render templates
-        timestamp = datetime.utcnow().isoformat() + "Z"
-
-        is_writable = container_data.get("is_writable", True)
-        container_type = container_data.get("container_type", "config")
-        supported_operations = container_data.get(
-            "supported_operations", ["get", "update", "replace", "delete"]
-        )
+        if timestamp is None:
+            timestamp = _utc_timestamp()
 
         # Use list key information already extracted and renamed above
-        has_list_keys = bool(list_keys_renamed)
+        # (has_list_keys was computed once before the skip check; renaming
+        # never changes the key count)
         list_path = list_info.get("list_path", "")
 
         template_context = {
@@ -124,26 +341,27 @@ class ActionGenerator:
             "list_path": list_path,
         }
 
-        # Render YAML
-        yaml_template = self.jinja_env.get_template("generated_action.yaml.j2")
-        yaml_content = yaml_template.render(template_context)
-
-        # Render Python
-        py_template = self.jinja_env.get_template("generated_action.py.j2")
-        py_content = py_template.render(template_context)
+        # Render templates (pre-compiled in __init__)
+        # Rendering per container is deliberate: specializing a pre-rendered
+        # skeleton per parameter signature via str.format was evaluated, but
+        # generated Python legitimately contains brace literals and the
+        # container identifiers are spread through both files, so plain
+        # formatting would be fragile for no measurable win once templates
+        # are compiled only once
+        rendered = self.combined_template.render(template_context)
+        yaml_content, py_content = rendered.split("---8<---\n", 1)
 
         # Write files
         yaml_file = os.path.join(self.output_dir, f"{action_name}.yaml")
         py_file = os.path.join(self.output_dir, f"{action_name}.py")
 
-        with open(yaml_file, "w") as f:
-            f.write(yaml_content)
-
-        with open(py_file, "w") as f:
-            f.write(py_content)
-
-        # Make Python file executable
-        os.chmod(py_file, 0o755)
+        # Raw os.open/os.write: one write syscall per file and no
+        # TextIOWrapper buffering/encoding layer - this runs once per
+        # container, so the syscall count adds up on slow (NFS) mounts
+        self._write_file(yaml_file, yaml_content)
+        # Python file is made executable on the open fd - no separate
+        # path-based chmod (and its extra directory lookup) afterwards
+        self._write_file(py_file, py_content, mode=0o755)
 
         return {
             "success": True,
@@ -155,133 +373,55 @@ class ActionGenerator:
             "py_file": py_file,
         }
 
-    def _build_action_name(self, device_name, module_name, container_path):
+    def _write_file(self, filepath, content, mode=0o644):
         """
-        Build clean action name following naming conventions
-        Automatically handles long filenames that exceed filesystem limits
+        Write rendered content with a single raw write syscall
 
-        Args:
-        device_name: Device identifier
-        module_name: YANG module name
-        container_path: Container path
+        Skips the write when the on-disk content already matches with the
+        '# Generated:' line masked out - that timestamp is fresh every
+        run, so comparing it verbatim would defeat the skip. Re-runs
+        against the same schema re-render otherwise identical files, and
+        leaving them untouched (old timestamp included) avoids needless
+        writes and keeps st2's action reload from seeing them as changed.
 
         Returns:
-        str: Action name (e.g., 'device_192_168_1_50_openconfig_interfaces_config')
-
-        Examples:
-        ('192.168.1.50', 'openconfig-interfaces', '/interfaces/interface/config')
-        -> 'device_192_168_1_50_openconfig_interfaces_interfaces_interface_config'
-
-        (Very long path with deep nesting)
-        -> 'device_192_168_1_50_openconfig_a1b2c3d4e5f6_config'
+            bool: True if the file was (re)written
         """
-        # Clean device name
-        clean_device = device_name.replace(".", "_").replace("-", "_")
-
-        # Clean module name (remove version suffix like @2021-01-01)
-        clean_module = module_name.split("@")[0].replace("-", "_")
-
-        # Extract container name from path
-        # '/interfaces/interface/config' -> 'interfaces_interface_config'
-        container_parts = container_path.strip("/").split("/")
-        clean_container = "_".join(container_parts)
-
-        # Build full name
-        action_name = f"device_{clean_device}_{clean_module}_{clean_container}"
-
-        # Ensure valid identifier (remove any remaining special chars)
-        action_name = re.sub(r"[^a-zA-Z0-9_]", "_", action_name)
-
-        # Remove consecutive underscores
-        action_name = re.sub(r"_+", "_", action_name)
-
-        # Handle filesystem filename length limit (255 chars max)
-        # Leave margin for .yaml/.py extension and safety
-        MAX_FILENAME_LENGTH = 200
-
-        if len(action_name) > MAX_FILENAME_LENGTH:
-            import hashlib
-
-            # Create short hash of the full name for uniqueness
-            hash_part = hashlib.md5(action_name.encode()).hexdigest()[:12]
-
-            # Keep the most meaningful parts:
-            # - Device identifier (always keep)
-            # - Module name (abbreviated)
-            # - Hash (for uniqueness)
-            # - Last 2-3 parts of container path (most specific)
-
-            device_prefix = f"device_{clean_device}"
-
-            # Take first word of module name
-            module_short = clean_module.split("_")[0]
-
-            # Take last 2 parts of container path
-            container_suffix = (
-                "_".join(container_parts[-2:])
-                if len(container_parts) >= 2
-                else clean_container
-            )
-
-            # Build shortened name: device_X_module_hash_container_end
-            action_name = (
-                f"{device_prefix}_{module_short}_{hash_part}_{container_suffix}"
-            )
-
-            # Clean any remaining special chars from the shortened name
-            action_name = re.sub(r"[^a-zA-Z0-9_]", "_", action_name)
-            action_name = re.sub(r"_+", "_", action_name)
-
-            # Final safety check - if still too long, just use hash
-            if len(action_name) > MAX_FILENAME_LENGTH:
-                action_name = f"{device_prefix}_{hash_part}"
-
-        return action_name.lower()
+        data = content.encode("utf-8")
+        try:
+            with open(filepath, "rb") as existing:
+                on_disk = existing.read()
+        except OSError:
+            on_disk = None
+        if on_disk is not None:
+            sub = _GENERATED_LINE_RE.sub
+            if sub(b"", on_disk) == sub(b"", data):
+                return False
+
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            if mode != 0o644:
+                # O_CREAT mode only applies to newly created files; fchmod
+                # covers regeneration over an existing file without a
+                # second path lookup
+                os.fchmod(fd, mode)
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        return True
+
+    # Thin forwarders: the builders are pure functions of their string
+    # arguments, so they live at module level under lru_cache - identical
+    # (device, module, container) tuples recur when regenerating against
+    # the same device set, and cache hits skip all the regex/hash work
+    def _build_action_name(self, device_name, module_name, container_path):
+        return _build_action_name(device_name, module_name, container_path)
 
     def _build_class_name(self, action_name):
-        """
-        Build Python class name from action name (PascalCase)
-
-        Args:
-            action_name: Action name (snake_case)
-
-        Returns:
-            str: Class name (PascalCase)
-
-        Example:
-            'device_192_168_1_50_openconfig_interfaces_config'
-            -> 'Device192168150OpenconfigInterfacesConfig'
-        """
-        parts = action_name.split("_")
-        return "".join(word.capitalize() for word in parts)
+        return _build_class_name(action_name)
 
     def _build_description(self, module_name, container_path, is_writable=True):
-        """
-        Build human-readable description for action with operation hint
-
-        Args:
-            module_name: YANG module name
-            container_path: Container path
-            is_writable: Whether container is writable (default: True)
-
-        Returns:
-            str: Description with operation hint
-
-        Examples:
-            (writable=True)  -> "Configure Openconfig Interfaces - Interface Config"
-            (writable=False) -> "Query Openconfig Interfaces - Interface State"
-        """
-        # Try to make it readable
-        module_readable = module_name.replace("-", " ").replace("_", " ").title()
-
-        # Get last part of path for context
-        path_parts = container_path.strip("/").split("/")
-        context = " ".join(path_parts[-2:]).replace("-", " ").title()
-
-        # Use appropriate verb based on writability
-        operation_verb = "Configure" if is_writable else "Query"
-
-        return f"{operation_verb} {module_readable} - {context}"
+        return _build_description(module_name, container_path, is_writable)
 
     def _extract_parameters(self, paths, list_key_names=None):
         """
@@ -311,41 +451,27 @@ class ActionGenerator:
             If path contains 'timeout', it becomes 'yang_timeout' to avoid
             conflict with python-script runner's timeout parameter.
         """
-        # Reserved parameter names from python-script runner
-        # These cannot be overridden by action parameters
-        RESERVED_PARAMS = {
-            "timeout",  # Action execution timeout
-            "sudo",  # Run with sudo
-            "env",  # Environment variables
-            "cwd",  # Working directory
-            "kwarg_op",  # Keyword argument operator
-        }
-
         parameters = {}
-        list_key_names = list_key_names or set()
+        list_key_names = list_key_names or ()
+        map_parameter = self.type_mapper.map_yang_to_st2_parameter
 
         for full_path, metadata in paths.items():
-            # Extract leaf name (last part of path)
-            leaf_name = full_path.strip("/").split("/")[-1]
-
-            # Convert YANG dashes to underscores for valid parameter names
-            param_name = leaf_name.replace("-", "_")
+            # Extract leaf name (last part of path) - rpartition scans
+            # once from the right with no intermediate list - and convert
+            # YANG dashes to underscores for valid parameter names
+            param_name = full_path.rstrip("/").rpartition("/")[2].replace("-", "_")
 
             # Skip if this parameter is a list key (will be added separately)
             if param_name in list_key_names:
                 continue
 
-            # Handle reserved parameter name conflicts
-            if param_name in RESERVED_PARAMS:
-                original_name = param_name
-                param_name = f"yang_{param_name}"
-                # Note: We could log this, but it would be too verbose
-                # self.logger.debug(f"Renamed '{original_name}' -> '{param_name}' to avoid runner conflict")
+            # Reserved runner parameter names get a 'yang_' prefix; the
+            # precomputed map makes the common (non-reserved) case a single
+            # dict probe with no branch or f-string
+            param_name = _RESERVED_MAP.get(param_name, param_name)
 
             # Map YANG metadata to ST2 parameter spec
-            param_spec = self.type_mapper.map_yang_to_st2_parameter(metadata)
-
-            parameters[param_name] = param_spec
+            parameters[param_name] = map_parameter(metadata)
 
         return parameters
 
@@ -361,16 +487,20 @@ class ActionGenerator:
         if len(list_keys) <= 1:
             return list_keys
 
-        # Check for duplicates
-        key_names = [key["name"] for key in list_keys]
-        if len(key_names) == len(set(key_names)):
+        # Check for duplicates with a single counting pass (instead of a
+        # per-key list.count scan, which is quadratic)
+        counts = {}
+        for key in list_keys:
+            counts[key["name"]] = counts.get(key["name"], 0) + 1
+
+        if len(counts) == len(list_keys):
             # No duplicates
             return list_keys
 
         # Rename duplicates based on their list container name
         renamed_keys = []
         for key in list_keys:
-            if key_names.count(key["name"]) > 1:
+            if counts[key["name"]] > 1:
                 # Duplicate - extract list container name from list_path
                 # /network-instances/network-instance → network_instance
                 # /vlans/vlan → vlan
@@ -6,8 +6,20 @@ Walks pyang's i_children tree which automatically expands:
 - Augments
 - Uses statements
 """
+import sys
+
 from type_extractor import TypeExtractor
 
+# Interned keyword constants: pyang keyword strings containing hyphens are
+# not auto-interned by CPython, so interning our side lets equality checks
+# hit the pointer-identity fast path whenever pyang's copy is shared
+_LEAF = sys.intern("leaf")
+_LEAF_LIST = sys.intern("leaf-list")
+_CONTAINER = sys.intern("container")
+_LIST = sys.intern("list")
+_CHOICE = sys.intern("choice")
+_CASE = sys.intern("case")
+
 
 class ASTWalker:
     """Walk YANG AST and extract all leaf paths (config=true and config=false)"""
@@ -15,6 +27,31 @@ class ASTWalker:
     def __init__(self):
         self.type_extractor = TypeExtractor()
         self.list_registry = {}
+        # Split key-name sets per list node, shared by every child leaf's
+        # _is_list_key check
+        self._list_keys_cache = {}
+        # Keyword -> handler dispatch for the walk: one dict probe per
+        # node instead of an elif chain of string comparisons
+        self._handlers = {
+            _LEAF: self._handle_leaf,
+            _LEAF_LIST: self._handle_leaf_list,
+            _CONTAINER: self._handle_container,
+            _LIST: self._handle_list,
+            _CHOICE: self._handle_choice,
+        }
+
+    def reset(self):
+        """
+        Clear per-module state so one walker can serve many modules
+
+        The registry is rebound (not cleared in place) so dicts already
+        handed out by get_list_registry stay valid. The handler table and
+        the type extractor - the expensive parts of construction - are
+        kept. The per-list key cache is dropped because it is keyed by
+        node id and only ever reused within a single module's walk.
+        """
+        self.list_registry = {}
+        self._list_keys_cache = {}
 
     def extract_paths(self, pyang_module):
         """
@@ -26,138 +63,165 @@ class ASTWalker:
         Returns:
             dict: {path: {type, config, description, enum, etc.}}
         """
-        paths = {}
+        # Accumulate (path, info) pairs and build the dict once at the
+        # end - the constructor pre-sizes the table, avoiding the rehash
+        # work of N incremental inserts into a growing dict
+        items = []
 
-        # Walk all top-level children
+        # Walk all top-level children with an explicit stack - a 10k-node
+        # tree otherwise pays Python frame setup per node
         # Note: i_children already has groupings expanded!
-        for child in pyang_module.i_children:
-            self._walk_node(child, [], paths)
-
-        return paths
-
-    def _walk_node(self, node, path_stack, paths, depth=0):
+        # Config status is threaded down the walk: each entry carries the
+        # value inherited from its ancestors (YANG default is config=true),
+        # so no leaf ever climbs back up the parent chain
+        stack = [(child, "", 0, True) for child in reversed(pyang_module.i_children)]
+        handlers = self._handlers
+
+        while stack:
+            node, path_prefix, depth, inherited_config = stack.pop()
+
+            # Safety: prevent runaway trees (mirrors the old recursion cap)
+            if depth > 50:
+                continue
+
+            handler = handlers.get(node.keyword)
+            if handler is not None:
+                # Build current path by extending the already-joined
+                # prefix - re-joining the whole ancestor chain per node
+                # would copy O(depth^2) characters over a walk
+                handler(
+                    node,
+                    path_prefix + "/" + node.arg,
+                    path_prefix,
+                    depth,
+                    inherited_config,
+                    items,
+                    stack,
+                )
+
+        return dict(items)
+
+    def _handle_leaf(
+        self, node, full_path, path_prefix, depth, inherited_config, items, stack
+    ):
+        """Leaf node - extract ALL leaves (config and state)"""
+        leaf_info = self._extract_leaf_info(node, inherited_config)
+
+        # Mark if this leaf is a list key
+        if self._is_list_key(node):
+            leaf_info["is_list_key"] = True
+            leaf_info["list_path"] = path_prefix or None
+
+        items.append((full_path, leaf_info))
+
+    def _handle_leaf_list(
+        self, node, full_path, path_prefix, depth, inherited_config, items, stack
+    ):
+        """Leaf-list - similar to leaf but multiple values"""
+        leaf_info = self._extract_leaf_info(node, inherited_config)
+        leaf_info["is_list"] = True
+        items.append((full_path, leaf_info))
+
+    def _handle_container(
+        self, node, full_path, path_prefix, depth, inherited_config, items, stack
+    ):
+        """Container - push children (reversed so the stack pops them in
+        document order, matching the old recursion)
+
+        Note: pyang's i_children already expands groupings and augments!
         """
-        Recursively walk YANG AST and extract all paths
-
-        Args:
-            node: Current pyang statement node
-            path_stack: Current path components (list)
-            paths: Dict to populate with paths
-            depth: Recursion depth (safety limit)
-        """
-        # Safety: prevent infinite recursion
-        if depth > 50:
-            return
-
-        # Build current path
-        current_path = path_stack + [node.arg]
-        full_path = "/" + "/".join(current_path)
-
-        # Detect list nodes and extract key metadata
-        if node.keyword == "list":
-            list_info = self._extract_list_metadata(node, full_path)
-            if list_info:
-                self.list_registry[full_path] = list_info
-
-        # Handle different node types
-        if node.keyword == "leaf":
-            # Leaf node - extract ALL leaves (config and state)
-            leaf_info = self._extract_leaf_info(node)
-
-            # Mark if this leaf is a list key
-            if self._is_list_key(node):
-                leaf_info["is_list_key"] = True
-                leaf_info["list_path"] = self._find_parent_list_path(path_stack)
-
-            if leaf_info:
-                paths[full_path] = leaf_info
-
-        elif node.keyword == "leaf-list":
-            # Leaf-list - similar to leaf but multiple values
-            leaf_info = self._extract_leaf_info(node)
-            if leaf_info:
-                leaf_info["is_list"] = True
-                paths[full_path] = leaf_info
-
-        elif node.keyword in ["container", "list"]:
-            # Container/List - recurse into children
-            # Note: pyang's i_children already expands groupings and augments!
-            if hasattr(node, "i_children") and node.i_children:
-                for child in node.i_children:
-                    self._walk_node(child, current_path, paths, depth + 1)
-
-        elif node.keyword == "choice":
-            # Choice statement - walk cases
-            if hasattr(node, "i_children"):
-                for child in node.i_children:
-                    if child.keyword == "case":
-                        # Don't add 'case' to path, just recurse into case children
-                        if hasattr(child, "i_children"):
-                            for case_child in child.i_children:
-                                self._walk_node(
-                                    case_child, current_path, paths, depth + 1
-                                )
-
-    def _get_config_status(self, node):
-        """
-        Get the config status of a node (config true/false)
-
-        In YANG, config is inherited from parent if not explicitly set.
-        Returns True if config=true (writable), False if config=false (read-only state)
+        children = getattr(node, "i_children", None)
+        if children:
+            current = self._own_config(node, inherited_config)
+            for child in reversed(children):
+                stack.append((child, full_path, depth + 1, current))
+
+    def _handle_list(
+        self, node, full_path, path_prefix, depth, inherited_config, items, stack
+    ):
+        """List - record key metadata, then recurse like a container"""
+        list_info = self._extract_list_metadata(node, full_path)
+        if list_info:
+            self.list_registry[full_path] = list_info
+
+        self._handle_container(
+            node, full_path, path_prefix, depth, inherited_config, items, stack
+        )
+
+    def _handle_choice(
+        self, node, full_path, path_prefix, depth, inherited_config, items, stack
+    ):
+        """Choice statement - walk cases
+
+        Don't add 'case' to the path, just push case children.
         """
-        # Check node's config statement
+        current = self._own_config(node, inherited_config)
+        for child in reversed(getattr(node, "i_children", None) or ()):
+            if child.keyword == _CASE:
+                case_config = self._own_config(child, current)
+                for case_child in reversed(getattr(child, "i_children", None) or ()):
+                    stack.append((case_child, full_path, depth + 1, case_config))
+
+    @staticmethod
+    def _own_config(node, inherited_config):
+        """Node's explicit config statement, else the inherited value"""
         config_stmt = node.search_one("config")
         if config_stmt:
             return config_stmt.arg == "true"
+        return inherited_config
 
-        # Check parent's config (inherited)
-        parent = node.parent
-        while parent:
-            config_stmt = parent.search_one("config")
-            if config_stmt:
-                return config_stmt.arg == "true"
-            parent = parent.parent
-
-        # Default in YANG is config=true
-        return True
-
-    def _extract_leaf_info(self, leaf_node):
+    def _extract_leaf_info(self, leaf_node, inherited_config=True):
         """
         Extract complete metadata from a leaf node
 
         Args:
             leaf_node: Pyang leaf statement
+            inherited_config: Config status inherited from the ancestors,
+                threaded down by the walk
 
         Returns:
             dict: Leaf metadata (type, description, mandatory, default, etc.)
         """
-        # Get actual config status from node
-        is_config = self._get_config_status(leaf_node)
+        # Index substatements in one pass - each search_one is a linear
+        # scan over substmts, and this method needed six of them per leaf.
+        # setdefault keeps the first statement per keyword, matching
+        # search_one's semantics
+        stmts = {}
+        for sub in leaf_node.substmts:
+            stmts.setdefault(sub.keyword, sub)
+
+        # Get actual config status: explicit statement on the leaf, else
+        # the value threaded down from the ancestors
+        config_stmt = stmts.get("config")
+        if config_stmt is not None:
+            is_config = config_stmt.arg == "true"
+        else:
+            is_config = inherited_config
 
         info = {"config": is_config, "readonly": not is_config}
 
         # Get description
-        desc_stmt = leaf_node.search_one("description")
+        desc_stmt = stmts.get("description")
         if desc_stmt:
             info["description"] = desc_stmt.arg.strip()
 
         # Get mandatory
-        mandatory_stmt = leaf_node.search_one("mandatory")
+        mandatory_stmt = stmts.get("mandatory")
         if mandatory_stmt:
             info["mandatory"] = mandatory_stmt.arg == "true"
 
         # Get default value
-        default_stmt = leaf_node.search_one("default")
+        default_stmt = stmts.get("default")
         if default_stmt:
             info["default"] = default_stmt.arg
 
         # Get units
-        units_stmt = leaf_node.search_one("units")
+        units_stmt = stmts.get("units")
         if units_stmt:
             info["units"] = units_stmt.arg
 
         # Get type information (THE CRITICAL PART for enum extraction!)
-        type_stmt = leaf_node.search_one("type")
+        type_stmt = stmts.get("type")
         if type_stmt:
             type_info = self.type_extractor.extract_type_info(type_stmt)
             info.update(type_info)
@@ -173,25 +237,34 @@ class ASTWalker:
         key_names = key_stmt.arg.split()
         keys = []
 
+        # Index leaf children by name once - scanning i_children per key
+        # name is O(keys x children) on wide lists with composite keys
+        child_by_arg = {
+            child.arg: child
+            for child in list_node.i_children
+            if child.keyword == _LEAF
+        }
+
         for key_name in key_names:
-            for child in list_node.i_children:
-                if child.keyword == "leaf" and child.arg == key_name:
-                    type_stmt = child.search_one("type")
-                    type_info = (
-                        self.type_extractor.extract_type_info(type_stmt)
-                        if type_stmt
-                        else {}
-                    )
-
-                    keys.append(
-                        {
-                            "name": key_name.replace("-", "_"),
-                            "yang_name": key_name,
-                            "type": type_info.get("type", "string"),
-                            "type_info": type_info,
-                        }
-                    )
-                    break
+            child = child_by_arg.get(key_name)
+            if child is None:
+                continue
+
+            type_stmt = child.search_one("type")
+            type_info = (
+                self.type_extractor.extract_type_info(type_stmt)
+                if type_stmt
+                else {}
+            )
+
+            keys.append(
+                {
+                    "name": key_name.replace("-", "_"),
+                    "yang_name": key_name,
+                    "type": type_info.get("type", "string"),
+                    "type_info": type_info,
+                }
+            )
 
         if not keys:
             return None
@@ -201,15 +274,18 @@ class ASTWalker:
     def _is_list_key(self, leaf_node):
         """Check if this leaf is a key for its parent list"""
         parent = leaf_node.parent
-        if parent and parent.keyword == "list":
-            key_stmt = parent.search_one("key")
-            if key_stmt and leaf_node.arg in key_stmt.arg.split():
-                return True
+        if parent and parent.keyword == _LIST:
+            return leaf_node.arg in self._list_key_names(parent)
         return False
 
-    def _find_parent_list_path(self, path_stack):
-        """Find the path to the parent list"""
-        return "/" + "/".join(path_stack) if path_stack else None
+    def _list_key_names(self, list_node):
+        """Key names of a list node, resolved and split once per list"""
+        key_names = self._list_keys_cache.get(id(list_node))
+        if key_names is None:
+            key_stmt = list_node.search_one("key")
+            key_names = frozenset(key_stmt.arg.split()) if key_stmt else frozenset()
+            self._list_keys_cache[id(list_node)] = key_names
+        return key_names
 
     def get_list_registry(self):
         """Return collected list metadata"""
@@ -4,6 +4,53 @@ Container Grouper - Group YANG paths by logical containers
 Organizes paths into actionable containers (e.g., /interfaces/interface/config)
 """
 
+import sys
+from functools import lru_cache
+
+# Shared operation tuples - every record references one of these two
+# immutable objects instead of allocating a fresh list per container
+_OPS_RW = ("get", "update", "replace", "delete")
+_OPS_RO = ("get",)
+
+
+@lru_cache(maxsize=8192)
+def _split_path(path):
+    """Segments of a '/'-separated YANG path as a shared tuple
+
+    Container and list paths recur across modules and call sites; caching
+    means each unique path is split once, and every later use gets the
+    same tuple back.
+    """
+    return tuple(path.strip("/").split("/"))
+
+
+class ContainerRecord:
+    """
+    One grouped container's data, slotted to keep the per-record
+    footprint small (a 6-key dict per container costs ~4x the memory
+    on schemas with tens of thousands of containers)
+    """
+
+    __slots__ = (
+        "paths",
+        "param_count",
+        "is_writable",
+        "container_type",
+        "supported_operations",
+        "list_info",
+    )
+
+    def __init__(
+        self, paths, param_count, is_writable, container_type,
+        supported_operations, list_info,
+    ):
+        self.paths = paths
+        self.param_count = param_count
+        self.is_writable = is_writable
+        self.container_type = container_type
+        self.supported_operations = supported_operations
+        self.list_info = list_info
+
 
 class ContainerGrouper:
     """Group YANG paths into logical containers for action generation"""
@@ -23,6 +70,14 @@ class ContainerGrouper:
         """
         self.yang_schema = yang_schema
         self.list_registry = list_registry or {}
+        # Per-module segment tries over the list registry, built lazily -
+        # ancestor-list lookups walk the trie instead of scanning every
+        # list path with startswith per container
+        self._list_trie_cache = {}
+        # Summary computed during the last group_by_container pass, so
+        # get_container_summary need not re-walk the grouped structure
+        self._last_grouped = None
+        self._last_summary = None
 
     def group_by_container(self, min_params=1):
         """
@@ -47,61 +102,128 @@ class ContainerGrouper:
         """
         grouped = {}
 
-        for module_name, module_data in self.yang_schema.items():
-            paths = module_data.get("paths", {})
-            if not paths:
-                continue
-
-            module_containers = {}
-
-            for path, metadata in paths.items():
-                # Find parent container
-                container_path = self._get_container_path(path)
-                if not container_path:
-                    continue
-
-                # Initialize container group with type detection
-                if container_path not in module_containers:
-                    # Detect container type from first path
-                    is_writable = metadata.get("config", True) and not metadata.get(
-                        "readonly", False
-                    )
-                    container_type = self._detect_container_type(
-                        container_path, is_writable
-                    )
-
-                    # Check if this container is under a list
-                    list_info = self._get_list_info(module_name, container_path)
-
-                    module_containers[container_path] = {
-                        "paths": {},
-                        "param_count": 0,
-                        "is_writable": is_writable,
-                        "container_type": container_type,
-                        "supported_operations": self._get_supported_operations(
-                            is_writable
-                        ),
-                        "list_info": list_info,
-                    }
-
-                # Add path to container
-                if not metadata.get("is_list_key", False):
-                    module_containers[container_path]["paths"][path] = metadata
-                    module_containers[container_path]["param_count"] += 1
+        # Summary totals accumulate in the same pass while the grouped
+        # records are still cache-warm, sparing get_container_summary a
+        # second full traversal
+        total_containers = total_paths = config_containers = 0
 
-            # Filter out containers with too few parameters
-            filtered_containers = {
-                path: data
-                for path, data in module_containers.items()
-                if data["param_count"] >= min_params
-                or data.get("list_info", {}).get("is_list", False)
-            }
+        for module_name, module_data in self.yang_schema.items():
+            filtered_containers = self._group_module(module_name, module_data, min_params)
 
             if filtered_containers:
                 grouped[module_name] = filtered_containers
+                total_containers += len(filtered_containers)
+                for data in filtered_containers.values():
+                    total_paths += data.param_count
+                    if data.is_writable:
+                        config_containers += 1
+
+        self._last_grouped = grouped
+        self._last_summary = {
+            "total_modules": len(grouped),
+            "total_containers": total_containers,
+            "total_paths": total_paths,
+            "config_containers": config_containers,
+            "state_containers": total_containers - config_containers,
+            "avg_paths_per_container": (
+                total_paths / total_containers if total_containers > 0 else 0
+            ),
+        }
 
         return grouped
 
+    def iter_containers(self, min_params=1):
+        """
+        Lazily yield (module_name, container_path, container_data) tuples
+
+        Groups one module at a time, so callers that stop early (e.g., a
+        max_actions limit) only pay for the modules they actually consume
+        instead of grouping the whole schema up front.
+        """
+        for module_name, module_data in self.yang_schema.items():
+            containers = self._group_module(module_name, module_data, min_params)
+            for container_path, container_data in containers.items():
+                yield module_name, container_path, container_data
+
+    def _group_module(self, module_name, module_data, min_params):
+        """
+        Group a single module's paths into containers
+
+        Returns:
+            dict: {container_path: container_data} after the min_params
+                  filter (may be empty)
+        """
+        paths = module_data.get("paths", {})
+        if not paths:
+            return {}
+
+        module_containers = {}
+
+        for path, metadata in paths.items():
+            # Find parent container
+            container_path = self._get_container_path(path)
+            if not container_path:
+                continue
+
+            # Every leaf under a container re-derives the same container
+            # string; interning makes the repeated dict probes below
+            # compare by identity and collapses the duplicates to one
+            # object per unique container
+            container_path = sys.intern(container_path)
+
+            # Initialize container group with type detection; the single
+            # .get probe replaces a membership test plus a second lookup
+            # for the write below
+            record = module_containers.get(container_path)
+            if record is None:
+                # Detect container type from first path. Type and
+                # operations are inlined here (see _detect_container_type
+                # and _get_supported_operations for the conventions) to
+                # skip two method dispatches per container
+                is_writable = metadata.get("config", True) and not metadata.get(
+                    "readonly", False
+                )
+                if container_path.endswith("/config"):
+                    container_type = "config"
+                elif container_path.endswith("/state"):
+                    container_type = "state"
+                else:
+                    container_type = "config" if is_writable else "state"
+
+                # Check if this container is under a list
+                list_info = self._get_list_info(module_name, container_path)
+
+                record = ContainerRecord(
+                    paths={},
+                    param_count=0,
+                    is_writable=is_writable,
+                    container_type=container_type,
+                    supported_operations=_OPS_RW if is_writable else _OPS_RO,
+                    list_info=list_info,
+                )
+                module_containers[container_path] = record
+
+            # Add path to container
+            if not metadata.get("is_list_key", False):
+                record.paths[path] = metadata
+                record.param_count += 1
+
+        # Filter out containers with too few parameters - prune in place
+        # instead of materializing a second dict of the survivors (which
+        # doubled peak memory for large modules). min_params <= 0 keeps
+        # everything, so the pass is skipped entirely
+        if min_params > 0:
+            doomed = [
+                path
+                for path, data in module_containers.items()
+                if data.param_count < min_params
+                and not data.list_info.get("is_list", False)
+            ]
+            for path in doomed:
+                del module_containers[path]
+
+        return module_containers
+
     def _get_container_path(self, full_path):
         """
         Extract container path from full leaf path
@@ -118,21 +240,12 @@ class ContainerGrouper:
             '/interfaces/interface/state/oper-status' -> '/interfaces/interface/state'
             '/system/config/hostname' -> '/system/config'
         """
-        # Remove leading slash and split
-        parts = full_path.strip("/").split("/")
-
-        # Need at least 2 parts (container + leaf)
-        if len(parts) < 2:
-            return None
-
-        # Container is everything except the last part (the leaf)
-        container_parts = parts[:-1]
-
-        # Prefer containers ending with 'config' or 'state'
-        # This follows OpenConfig/IETF conventions
-        container_path = "/" + "/".join(container_parts)
-
-        return container_path
+        # Container is everything before the last '/' - rpartition does it
+        # in one C-level scan with no intermediate list. Walker paths are
+        # always '/'-rooted, so a top-level leaf ('/hostname') leaves an
+        # empty head, which maps to None (nothing to group under)
+        head = full_path.rpartition("/")[0]
+        return head or None
 
     def get_container_summary(self, grouped_containers):
         """
@@ -144,23 +257,24 @@ class ContainerGrouper:
         Returns:
             dict: Summary statistics with container type breakdown
         """
+        # Fast path: the totals for the last group_by_container result
+        # were already accumulated during grouping
+        if grouped_containers is self._last_grouped:
+            return self._last_summary
+
         total_modules = len(grouped_containers)
-        total_containers = sum(
-            len(containers) for containers in grouped_containers.values()
-        )
-        total_paths = sum(
-            data["param_count"]
-            for module_data in grouped_containers.values()
-            for data in module_data.values()
-        )
-
-        # Count by container type
-        config_containers = sum(
-            1
-            for module_data in grouped_containers.values()
-            for data in module_data.values()
-            if data.get("is_writable", True)
-        )
+
+        # Single fused pass: counting containers, paths and the type
+        # breakdown separately would walk the whole nested structure once
+        # per statistic
+        total_containers = total_paths = config_containers = 0
+        for module_data in grouped_containers.values():
+            total_containers += len(module_data)
+            for data in module_data.values():
+                total_paths += data.param_count
+                if data.is_writable:
+                    config_containers += 1
+
         state_containers = total_containers - config_containers
         return {
             "total_modules": total_modules,
@@ -220,9 +334,9 @@ class ContainerGrouper:
             is_writable=False -> ['get']
         """
         if is_writable:
-            return ["get", "update", "replace", "delete"]
+            return _OPS_RW
         else:
-            return ["get"]  # Read-only: only get supported
+            return _OPS_RO  # Read-only: only get supported
 
     def _get_list_info(self, module_name, container_path):
         """
@@ -233,42 +347,63 @@ class ContainerGrouper:
         - /network-instances/network-instance → key: name
         - /network-instances/network-instance/vlans/vlan → key: vlan-id
         """
-        module_lists = self.list_registry.get(module_name, {})
+        module_lists = self.list_registry.get(module_name)
+        if not module_lists:
+            return {"is_list": False}
+
+        trie = self._list_trie_cache.get(module_name)
+        if trie is None:
+            trie = self._build_list_trie(module_lists)
+            self._list_trie_cache[module_name] = trie
 
-        # Find ALL matching list paths (for nested lists)
+        # Descend the trie along the container's segments; every list node
+        # passed on the way down (strictly above the container) is an
+        # ancestor match, collected shortest-to-longest so no sort needed
+        parts = _split_path(container_path)
+        last = len(parts) - 1
         matching_lists = []
 
-        for list_path, list_meta in module_lists.items():
-            if container_path.startswith(list_path + "/"):
-                matching_lists.append(
-                    {
-                        "list_path": list_path,
-                        "keys": list_meta["keys"],
-                        "length": len(list_path),
-                    }
-                )
+        node = trie
+        for i, segment in enumerate(parts):
+            node = node.get(segment)
+            if node is None:
+                break
+            if "__keys__" in node and i < last:
+                matching_lists.append(node)
 
         if not matching_lists:
             return {"is_list": False}
 
-        # Sort by length (shortest to longest) to build path correctly
-        matching_lists.sort(key=lambda x: x["length"])
-
-        # Combine all keys but preserve which list they belong to
+        # Combine all keys; each trie node already carries its keys
+        # annotated with list_path, so this is a couple of extends per
+        # container instead of a dict copy per key
         all_keys = []
         for match in matching_lists:
-            for key in match["keys"]:
-                # Add list_path to each key so we know where to insert it
-                key_with_path = key.copy()
-                key_with_path["list_path"] = match["list_path"]
-                all_keys.append(key_with_path)
+            all_keys.extend(match["__keys__"])
 
         # Use the longest (innermost) list path as the primary list path
         innermost_list = matching_lists[-1]
 
         return {
             "is_list": True,
-            "list_path": innermost_list["list_path"],
+            "list_path": innermost_list["__path__"],
             "keys": all_keys,
-            "all_list_paths": [m["list_path"] for m in matching_lists],
+            "all_list_paths": [m["__path__"] for m in matching_lists],
         }
+
+    @staticmethod
+    def _build_list_trie(module_lists):
+        """Build a path-segment trie over a module's list registry"""
+        trie = {}
+        for list_path, list_meta in module_lists.items():
+            node = trie
+            for segment in _split_path(list_path):
+                node = node.setdefault(segment, {})
+            # Annotate keys with their list_path once here, instead of
+            # copying every key dict for every container that matches the
+            # list. The registry's own dicts are left untouched
+            node["__keys__"] = [
+                dict(key, list_path=list_path) for key in list_meta["keys"]
+            ]
+            node["__path__"] = list_path
+        return trie
@@ -3,8 +3,15 @@
 Pack Utilities - Shared functions for pack management
 Used by downloader, parser, and generator to maintain consistent naming
 """
+import os
+from functools import lru_cache
 
+# Single-pass sanitizer table: dots and dashes become underscores in one
+# C-level translate instead of two chained replace passes
+_PACK_TRANS = str.maketrans({".": "_", "-": "_"})
 
+
+@lru_cache(maxsize=256)
 def generate_pack_name(device_identifier):
     """
     Generate device pack name from device identifier
@@ -26,13 +33,15 @@ def generate_pack_name(device_identifier):
         'switch.example.com' -> 'device_switch_example_com'
     """
     # Replace dots and dashes with underscores for valid pack name
-    clean_name = device_identifier.replace(".", "_").replace("-", "_")
+    # (memoized - every action asks for the same handful of devices)
+    clean_name = device_identifier.translate(_PACK_TRANS)
 
     # Ensure it doesn't start with a number (StackStorm pack requirement)
     # Pack names must start with a letter
     return f"device_{clean_name}"
 
 
+@lru_cache(maxsize=256)
 def get_pack_base_dir(device_identifier, base_path="/opt/stackstorm/packs.dev"):
     """
     Get full path to device pack directory
@@ -52,6 +61,7 @@ def get_pack_base_dir(device_identifier, base_path="/opt/stackstorm/packs.dev"):
     return f"{base_path}/{pack_name}"
 
 
+@lru_cache(maxsize=256)
 def get_yang_models_path(device_identifier, base_path="/opt/stackstorm/packs.dev"):
     """
     Get full path to YANG models directory for a device
@@ -71,6 +81,41 @@ def get_yang_models_path(device_identifier, base_path="/opt/stackstorm/packs.dev
     return f"{pack_dir}/yang_models/raw"
 
 
+def get_cache_dir(subdir=None):
+    """
+    Per-user cache directory for pickle/sidecar caches
+
+    Caches must never live under world-writable /tmp: anyone on the box
+    could pre-create the path and plant pickles that unpickle - execute
+    code - as the action user. The root lives under the user's cache
+    home, is created 0700, and is refused (returning None, which callers
+    treat as "cache unavailable") if it turns out not to be owned by the
+    current uid.
+
+    Args:
+        subdir: Optional subdirectory below the cache root
+
+    Returns:
+        str: Usable cache directory path, or None when it cannot be
+             created or is not exclusively ours
+    """
+    root = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+        "gnmi_toolkit",
+    )
+    path = root if subdir is None else os.path.join(root, subdir)
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        root_stat = os.stat(root)
+        path_stat = os.stat(path)
+    except OSError:
+        return None
+    uid = os.getuid()
+    if root_stat.st_uid != uid or path_stat.st_uid != uid:
+        return None
+    return path
+
+
 def get_virtualenv_path(pack_name, base_path="/opt/stackstorm/virtualenvs"):
     """
     Get full path to pack's virtual environment
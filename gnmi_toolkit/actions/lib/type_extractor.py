@@ -4,6 +4,72 @@
 Type Extractor - Extract type metadata from YANG nodes
 Handles enum extraction from imported groupings (fixes the enum bug!)
 """
+import sys
+from functools import lru_cache
+
+# YANG integer base types - frozenset membership is one hash probe in the
+# hot per-leaf dispatch below
+_INT_TYPES = frozenset(
+    {"int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64"}
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_range(range_str):
+    """
+    Parse YANG range/length statement (simplified)
+
+    Extracts numeric min/max bounds and preserves raw string.
+    Pipe (|) in YANG means OR - value must match one of the ranges.
+
+    Args:
+        range_str: YANG range string (e.g., "1..10 | 100..1000")
+
+    Returns:
+        dict: {'raw': str, 'min': int, 'max': int}
+
+    Examples:
+        "1..100" -> {'raw': '1..100', 'min': 1, 'max': 100}
+        "1..10 | 100..1000" -> {'raw': '1..10 | 100..1000', 'min': 1, 'max': 1000}
+    """
+    result = {"raw": range_str}
+
+    # Fast path: plain "a..b" with numeric bounds (the overwhelming
+    # majority) - one partition, no intermediate lists
+    if "|" not in range_str:
+        low_str, sep, high_str = range_str.partition("..")
+        if sep:
+            try:
+                low = int(low_str.strip())
+                high = int(high_str.strip())
+            except ValueError:
+                pass  # YANG 'min'/'max' keywords - use the general path
+            else:
+                result["min"] = min(low, high)
+                result["max"] = max(low, high)
+                return result
+
+    try:
+        # Extract all numbers: replace pipes with ".." then split
+        # "1..10 | 100..1000" -> "1..10 .. 100..1000" -> ["1", "10", "100", "1000"]
+        parts = range_str.replace("|", "..").split("..")
+        numbers = []
+
+        for part in parts:
+            try:
+                numbers.append(int(part.strip()))
+            except ValueError:
+                pass  # Skip non-numeric (like YANG 'min'/'max' keywords)
+
+        # Store overall min/max if we found any numbers
+        if numbers:
+            result["min"] = min(numbers)
+            result["max"] = max(numbers)
+
+    except Exception:
+        pass  # Just return raw if parsing fails
+
+    return result
 
 
 class TypeExtractor:
@@ -34,11 +100,30 @@ class TypeExtractor:
                 type_name = typedef_type_stmt.arg
 
         # Store base type
-        type_info["type"] = type_name
+        # Intern the type name: a schema repeats the same handful of
+        # names ("string", "uint32", ...) across thousands of leaves, and
+        # interning collapses them to one object each
+        type_info["type"] = sys.intern(type_name)
 
         # Extract type-specific information from resolved type statement
 
-        if type_name == "enumeration":
+        # Branches ordered by how often the types occur in practice:
+        # strings and integers dominate typical OpenConfig/IETF modules
+        if type_name == "string":
+            length_stmt = resolved_type_stmt.search_one("length")
+            if length_stmt:
+                type_info["length"] = self._parse_range(length_stmt.arg)
+
+            pattern_stmts = resolved_type_stmt.search("pattern")
+            if pattern_stmts:
+                type_info["patterns"] = [p.arg for p in pattern_stmts]
+
+        elif type_name in _INT_TYPES:
+            range_stmt = resolved_type_stmt.search_one("range")
+            if range_stmt:
+                type_info["range"] = self._parse_range(range_stmt.arg)
+
+        elif type_name == "enumeration":
             enum_stmts = resolved_type_stmt.search("enum")
             if enum_stmts:
                 type_info["enum"] = [e.arg for e in enum_stmts]
@@ -48,29 +133,6 @@ class TypeExtractor:
             if union_types:
                 type_info["union_types"] = [t.arg for t in union_types]
 
-        elif type_name in [
-            "int8",
-            "int16",
-            "int32",
-            "int64",
-            "uint8",
-            "uint16",
-            "uint32",
-            "uint64",
-        ]:
-            range_stmt = resolved_type_stmt.search_one("range")
-            if range_stmt:
-                type_info["range"] = self._parse_range(range_stmt.arg)
-
-        elif type_name == "string":
-            length_stmt = resolved_type_stmt.search_one("length")
-            if length_stmt:
-                type_info["length"] = self._parse_range(length_stmt.arg)
-
-            pattern_stmts = resolved_type_stmt.search("pattern")
-            if pattern_stmts:
-                type_info["patterns"] = [p.arg for p in pattern_stmts]
-
         elif type_name == "leafref":
             path_stmt = resolved_type_stmt.search_one("path")
             if path_stmt:
@@ -93,43 +155,7 @@ class TypeExtractor:
 
         return type_info
 
-    def _parse_range(self, range_str):
-        """
-        Parse YANG range/length statement (simplified)
-
-        Extracts numeric min/max bounds and preserves raw string.
-        Pipe (|) in YANG means OR - value must match one of the ranges.
-
-        Args:
-            range_str: YANG range string (e.g., "1..10 | 100..1000")
-
-        Returns:
-            dict: {'raw': str, 'min': int, 'max': int}
-
-        Examples:
-            "1..100" -> {'raw': '1..100', 'min': 1, 'max': 100}
-            "1..10 | 100..1000" -> {'raw': '1..10 | 100..1000', 'min': 1, 'max': 1000}
-        """
-        result = {"raw": range_str}
-
-        try:
-            # Extract all numbers: replace pipes with ".." then split
-            # "1..10 | 100..1000" -> "1..10 .. 100..1000" -> ["1", "10", "100", "1000"]
-            parts = range_str.replace("|", "..").split("..")
-            numbers = []
-
-            for part in parts:
-                try:
-                    numbers.append(int(part.strip()))
-                except ValueError:
-                    pass  # Skip non-numeric (like YANG 'min'/'max' keywords)
-
-            # Store overall min/max if we found any numbers
-            if numbers:
-                result["min"] = min(numbers)
-                result["max"] = max(numbers)
-
-        except Exception:
-            pass  # Just return raw if parsing fails
-
-        return result
+    # Memoized at module level: schemas reuse a small vocabulary of
+    # ranges ("0..65535", "1..4094", ...), so repeats become a dict hit.
+    # Cached dicts are shared - callers must treat them as read-only
+    _parse_range = staticmethod(_parse_range)
@@ -5,9 +5,34 @@ Converts YANG type metadata (enum, range, pattern) to ST2 action parameters
 """
 
 
+def _parse_bool_default(default_str):
+    return default_str.lower() in ("true", "1", "yes")
+
+
+# Default-value converters keyed by ST2 type: one dict probe per
+# defaulted leaf instead of a string-compare chain. Absent types
+# (string, array) pass the value through unchanged
+_DEFAULT_CONVERTERS = {
+    "integer": int,
+    "number": float,
+    "boolean": _parse_bool_default,
+}
+
+
+def _freeze(info):
+    """Hashable form of an optional constraint dict for cache keys"""
+    return tuple(sorted(info.items())) if info else None
+
+
 class TypeMapper:
     """Map YANG types to StackStorm parameter types with constraints"""
 
+    def __init__(self):
+        # Lookaside cache of compiled (spec template, description suffix)
+        # pairs keyed by constraint signature - large schemas reuse a few
+        # hundred distinct signatures across tens of thousands of leaves
+        self._spec_cache = {}
+
     # MongoDB 8-byte signed integer limits (ST2 uses MongoDB for storage)
     # Max value: 2^63 - 1 = 9223372036854775807
     # Min value: -(2^63) = -9223372036854775808
@@ -69,91 +94,162 @@ class TypeMapper:
         """
         yang_type = path_metadata.get("type", "string")
 
-        # Start with base type mapping
-        st2_type = self.YANG_TO_ST2_TYPE_MAP.get(yang_type, "string")
+        # Constraint signature: everything that shapes the spec except the
+        # per-leaf description and default. Leaves with the same signature
+        # (e.g. hundreds of uint16 0..65535 counters) share one compiled
+        # template and pay a single dict copy each
+        signature = (
+            yang_type,
+            path_metadata.get("mandatory", False),
+            _freeze(path_metadata.get("range")),
+            tuple(path_metadata.get("enum") or ()),
+            _freeze(path_metadata.get("length")),
+            tuple(path_metadata.get("patterns") or ()),
+            tuple(path_metadata.get("union_types") or ()),
+            path_metadata.get("leafref_path"),
+            path_metadata.get("identity_base"),
+        )
 
-        param_spec = {
-            "type": st2_type,
-            "required": False,  # Most YANG leaves are optional
-        }
+        cached = self._spec_cache.get(signature)
+        if cached is None:
+            cached = self._build_spec_template(yang_type, path_metadata)
+            self._spec_cache[signature] = cached
+        template, desc_suffix = cached
+
+        param_spec = template.copy()
 
-        # Add description if available
+        # Per-leaf fields: description prefix and default value
+        desc = ""
         if "description" in path_metadata:
-            desc = path_metadata["description"].replace('"', '\\"').replace("\n", " ")
+            desc = path_metadata["description"]
+            # Escape only when needed - the membership scan is cheaper
+            # than two unconditional replace passes that always allocate
+            if '"' in desc:
+                desc = desc.replace('"', '\\"')
+            if "\n" in desc:
+                desc = desc.replace("\n", " ")
             # Truncate very long descriptions
             if len(desc) > 200:
                 desc = desc[:197] + "..."
-            param_spec["description"] = desc
 
-        # Add mandatory flag
-        if path_metadata.get("mandatory", False):
-            param_spec["required"] = True
+        if desc or desc_suffix:
+            param_spec["description"] = desc + desc_suffix
 
         # Add default value (convert to appropriate type)
         if "default" in path_metadata:
             default_val = path_metadata["default"]
-            param_spec["default"] = self._convert_default_value(default_val, st2_type)
+            convert = _DEFAULT_CONVERTERS.get(param_spec["type"])
+            if convert is not None:
+                try:
+                    default_val = convert(default_val)
+                except (ValueError, AttributeError):
+                    # If conversion fails, keep the YANG string as-is
+                    pass
+            param_spec["default"] = default_val
 
-        # Apply type-specific constraints
+        return param_spec
 
-        # Enumeration constraints
-        if "enum" in path_metadata and path_metadata["enum"]:
-            param_spec["enum"] = path_metadata["enum"]
+    def _build_spec_template(self, yang_type, path_metadata):
+        """
+        Compile the shared part of a parameter spec for one signature
 
-        # Integer range constraints (cap at MongoDB limits)
-        if "range" in path_metadata:
-            range_info = path_metadata["range"]
+        Returns:
+            tuple: (spec template dict, description suffix string)
+        """
+        # The fused dispatch returns the ST2 type and the constraint
+        # handler from a single probe
+        st2_type, handler = self._TYPE_DISPATCH.get(yang_type, ("string", None))
+
+        param_spec = {
+            "type": st2_type,
+            "required": False,  # Most YANG leaves are optional
+        }
+
+        # Add mandatory flag
+        if path_metadata.get("mandatory", False):
+            param_spec["required"] = True
+
+        # Apply type-specific constraints - only the code relevant to
+        # this base type runs, instead of probing every constraint key
+        # for every leaf. Handlers append description suffixes (length,
+        # union, ref, identity) which are part of the cached template
+        desc_parts = []
+        if handler is not None:
+            handler(self, param_spec, path_metadata, desc_parts)
+
+        return param_spec, "".join(desc_parts)
+
+    def _apply_int_constraints(self, param_spec, path_metadata, desc_parts):
+        """Integer range constraints (capped at MongoDB limits)"""
+        range_info = path_metadata.get("range")
+        if range_info:
             if "min" in range_info:
-                min_val = range_info["min"]
                 # Cap at MongoDB minimum
-                param_spec["minimum"] = max(min_val, self.MONGODB_INT_MIN)
+                param_spec["minimum"] = max(range_info["min"], self.MONGODB_INT_MIN)
             if "max" in range_info:
-                max_val = range_info["max"]
                 # Cap at MongoDB maximum
-                param_spec["maximum"] = min(max_val, self.MONGODB_INT_MAX)
+                param_spec["maximum"] = min(range_info["max"], self.MONGODB_INT_MAX)
 
-        # String length constraints
-        if "length" in path_metadata:
-            length_info = path_metadata["length"]
+    def _apply_string_constraints(self, param_spec, path_metadata, desc_parts):
+        """String length (description-only) and pattern constraints"""
+        length_info = path_metadata.get("length")
+        if length_info and ("min" in length_info or "max" in length_info):
             # ST2 doesn't have native minLength/maxLength, store in description
-            if "min" in length_info or "max" in length_info:
-                length_desc = f" (length: {length_info.get('min', 0)}-{length_info.get('max', 'unlimited')})"
-                param_spec["description"] = (
-                    param_spec.get("description", "") + length_desc
-                )
-
-        # String pattern constraints
-        if "patterns" in path_metadata and path_metadata["patterns"]:
+            desc_parts.append(
+                f" (length: {length_info.get('min', 0)}-{length_info.get('max', 'unlimited')})"
+            )
+
+        patterns = path_metadata.get("patterns")
+        if patterns:
             # Use first pattern if multiple
-            param_spec["pattern"] = path_metadata["patterns"][0]
+            param_spec["pattern"] = patterns[0]
 
-        # Union types - use string with description
+    def _apply_enum_constraints(self, param_spec, path_metadata, desc_parts):
+        """Enumeration value constraints"""
+        if path_metadata.get("enum"):
+            param_spec["enum"] = path_metadata["enum"]
+
+    def _apply_union_constraints(self, param_spec, path_metadata, desc_parts):
+        """Union types - note member types in the description"""
         if "union_types" in path_metadata:
             union_types = ", ".join(path_metadata["union_types"])
-            param_spec["description"] = (
-                param_spec.get("description", "") + f" (union: {union_types})"
-            )
+            desc_parts.append(f" (union: {union_types})")
 
-        # Leafref - add path reference in description
+    def _apply_leafref_constraints(self, param_spec, path_metadata, desc_parts):
+        """Leafref - add path reference in description"""
         if "leafref_path" in path_metadata:
-            param_spec["description"] = (
-                param_spec.get("description", "")
-                + f" (ref: {path_metadata['leafref_path']})"
-            )
+            desc_parts.append(f" (ref: {path_metadata['leafref_path']})")
 
-        # Identity reference
+    def _apply_identityref_constraints(self, param_spec, path_metadata, desc_parts):
+        """Identity reference - note the base identity in the description"""
         if "identity_base" in path_metadata:
-            param_spec["description"] = (
-                param_spec.get("description", "")
-                + f" (identity: {path_metadata['identity_base']})"
-            )
+            desc_parts.append(f" (identity: {path_metadata['identity_base']})")
 
-        return param_spec
+    # Per-type constraint dispatch: one .get on the leaf's base type
+    # replaces probing every constraint key on every leaf
+    _CONSTRAINT_HANDLERS = {
+        "int8": _apply_int_constraints,
+        "int16": _apply_int_constraints,
+        "int32": _apply_int_constraints,
+        "int64": _apply_int_constraints,
+        "uint8": _apply_int_constraints,
+        "uint16": _apply_int_constraints,
+        "uint32": _apply_int_constraints,
+        "uint64": _apply_int_constraints,
+        "string": _apply_string_constraints,
+        "enumeration": _apply_enum_constraints,
+        "union": _apply_union_constraints,
+        "leafref": _apply_leafref_constraints,
+        "identityref": _apply_identityref_constraints,
+    }
 
     def _convert_default_value(self, default_str, st2_type):
         """
         Convert YANG default string to appropriate Python/ST2 type
 
+        Thin wrapper over the module-level converter table; the mapping
+        hot path inlines the same lookup to skip this call per leaf.
+
         Args:
             default_str: Default value as string from YANG
             st2_type: Target ST2 type
@@ -161,15 +257,19 @@ class TypeMapper:
         Returns:
             Converted value (int, bool, str, etc.)
         """
+        convert = _DEFAULT_CONVERTERS.get(st2_type)
+        if convert is None:
+            return default_str
         try:
-            if st2_type == "integer":
-                return int(default_str)
-            elif st2_type == "number":
-                return float(default_str)
-            elif st2_type == "boolean":
-                return default_str.lower() in ("true", "1", "yes")
-            else:
-                return default_str
+            return convert(default_str)
         except (ValueError, AttributeError):
             # If conversion fails, return as string
             return default_str
+
+
+# Fused at import: pairing the ST2 type with its constraint handler lets
+# map_yang_to_st2_parameter resolve both with one dict access per leaf
+TypeMapper._TYPE_DISPATCH = {
+    yang_type: (st2_type, TypeMapper._CONSTRAINT_HANDLERS.get(yang_type))
+    for yang_type, st2_type in TypeMapper.YANG_TO_ST2_TYPE_MAP.items()
+}
@@ -8,6 +8,7 @@ Loads YANG modules and creates pyang context for parsing
 
 from pyang import repository, context
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 
 class YangParser:
@@ -35,8 +36,14 @@ class YangParser:
         if not os.path.exists(self.yang_path):
             raise FileNotFoundError(f"YANG path not found: {self.yang_path}")
 
-        # Get all .yang files
-        yang_files = [f[:-5] for f in os.listdir(self.yang_path) if f.endswith(".yang")]
+        # Get all .yang files - scandir returns name and type in one
+        # syscall per entry, where listdir + per-file stat needs two
+        with os.scandir(self.yang_path) as entries:
+            yang_files = [
+                (entry.name[:-5], entry.path)
+                for entry in entries
+                if entry.name.endswith(".yang") and entry.is_file()
+            ]
 
         if not yang_files:
             raise ValueError(f"No .yang files found in {self.yang_path}")
@@ -45,16 +52,28 @@ class YangParser:
         self.repos = repository.FileRepository(self.yang_path)
         self.ctx = context.Context(self.repos)
 
+        # Prefetch file bodies with a thread pool: read() releases the
+        # GIL, so the per-file I/O latency overlaps instead of stacking
+        # serially. pyang itself is fed sequentially below - add_module
+        # is not thread-safe
+        def _read_text(item):
+            try:
+                with open(item[1], "r", encoding="utf-8") as f:
+                    return f.read()
+            except OSError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            texts = list(executor.map(_read_text, yang_files))
+
         # Add all modules to context (handles imports/dependencies)
         modules_loaded = {}
         failed_modules = []
-        for module_name in yang_files:
+        for (module_name, file_path), text in zip(yang_files, texts):
+            if isinstance(text, OSError):
+                failed_modules.append((module_name, str(text)))
+                continue
             try:
-                # Read the YANG file content
-                file_path = os.path.join(self.yang_path, f"{module_name}.yang")
-                with open(file_path, "r", encoding="utf-8") as f:
-                    text = f.read()
-
                 # Add module with text content
                 module = self.ctx.add_module(file_path, text)
                 if module:
@@ -3,20 +3,114 @@
 from st2common.runners.base_action import Action
 import os
 import sys
+import base64
+import gzip
 import json
+import pickle
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# orjson encodes large payloads ~3-5x faster than stdlib json and writes
+# straight to bytes; fall back to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add lib to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "lib"))
 from yang_parser import YangParser
 from ast_walker import ASTWalker
-from pack_utils import get_yang_models_path, generate_pack_name
+from pack_utils import get_yang_models_path, generate_pack_name, get_cache_dir
+
+
+# Payloads above this size are stored gzip-compressed. Small ones stay
+# plain JSON - compression overhead isn't worth it below this
+_COMPRESS_MIN_BYTES = 64 * 1024
+
+
+def _encode_payload(obj):
+    """
+    Encode a datastore JSON payload, compressing large ones
+
+    Catalogs serialize to multi-MB JSON whose repeated path prefixes
+    compress 5-10x; large payloads are stored as 'gz:' + base64(gzip(
+    json)), which keeps them well under datastore value-size limits.
+    JSON never starts with 'gz:', so readers can sniff the prefix
+    instead of consulting a side marker.
+    """
+    if orjson is not None:
+        raw = orjson.dumps(obj)
+    else:
+        raw = json.dumps(obj).encode("utf-8")
+    if len(raw) < _COMPRESS_MIN_BYTES:
+        return raw.decode("utf-8")
+    # mtime=0 keeps the gzip header deterministic: the version stamp is a
+    # hash of this payload, and a timestamped header would change it on
+    # every run, invalidating the generator's sidecar cache for nothing
+    compressed = gzip.compress(raw, compresslevel=3, mtime=0)
+    return "gz:" + base64.b64encode(compressed).decode("ascii")
+
+# Parsed-catalog disk cache (under the per-user cache root), keyed by a
+# fingerprint of the .yang files. Re-parsing an unchanged model set is
+# pure recomputation; a warm run loads the whole catalog back in
+# milliseconds instead of seconds
+_CATALOG_CACHE_SUBDIR = "catalog"
+
+# Bump when the shape of path_catalog / list_registry changes, so stale
+# cache entries from older code are never returned
+_CATALOG_CACHE_VERSION = 1
+
+# Per-process YangParser for pool workers. AST walking is pure-Python CPU
+# work, so threads serialize on the GIL; processes actually use the cores.
+# pyang module objects don't pickle, so each worker loads the context once
+# in the initializer and then receives only module names
+_worker_parser = None
+_worker_walker = None
+
+
+def _init_parse_worker(yang_path):
+    """Pool initializer: load the pyang context in this worker"""
+    global _worker_parser, _worker_walker
+    _worker_parser = YangParser(yang_path)
+    _worker_parser.load_modules()
+    # One walker per worker, reset between modules - its dispatch table
+    # and type extractor are built once instead of per module
+    _worker_walker = ASTWalker()
+
+
+def _parse_one_module(module_name):
+    """Pool entry point - walk one module in the per-process context
+
+    Failures are returned as the fourth element rather than raised:
+    executor.map aborts the whole result stream on the first exception,
+    and one bad module must not take down the run.
+    """
+    module = _worker_parser.get_module(module_name)
+    if module is None:
+        return module_name, {}, {}, None
+    try:
+        walker = _worker_walker
+        walker.reset()
+        paths = walker.extract_paths(module)
+        return module_name, paths, walker.get_list_registry(), None
+    except Exception as e:
+        return module_name, {}, {}, str(e)
 
 
 class YangParseModelsAction(Action):
 
-    def run(self, device_name, yang_path=None, workers=10, store_in_datastore=True):
+    def run(
+        self,
+        device_name,
+        yang_path=None,
+        workers=10,
+        store_in_datastore=True,
+        include_sample=True,
+    ):
         """Parse YANG models using pyang library"""
 
         start_time = time.time()
@@ -26,69 +120,118 @@ class YangParseModelsAction(Action):
             yang_path = get_yang_models_path(device_name)
 
         pack_name = generate_pack_name(device_name)
-        self.logger.info(f"Parsing YANG models for device: {device_name}")
-        self.logger.info(f"Device pack: {pack_name}")
-        self.logger.info(f"YANG path: {yang_path}")
+        self.logger.info("Parsing YANG models for device: %s", device_name)
+        self.logger.info("Device pack: %s", pack_name)
+        self.logger.info("YANG path: %s", yang_path)
 
         try:
-            # Load YANG modules
-            self.logger.info("Loading YANG modules...")
-            load_start = time.time()
+            # Content-keyed cache: if no .yang file changed since the last
+            # run, the whole parse is a deterministic recomputation and the
+            # cached catalog is returned instead
+            cache_key = self._yang_dir_fingerprint(yang_path)
+            cached = self._load_catalog_cache(cache_key)
+
+            if cached is not None:
+                path_catalog, list_registry = cached
+                load_time = parse_time = 0.0
+                total_paths = sum(
+                    data["path_count"] for data in path_catalog.values()
+                )
+                self.logger.info(
+                    "Loaded cached catalog: %d paths from %d modules "
+                    "(YANG files unchanged)",
+                    total_paths,
+                    len(path_catalog),
+                )
+            else:
+                # Load YANG modules
+                self.logger.info("Loading YANG modules...")
+                load_start = time.time()
 
-            parser = YangParser(yang_path)
-            modules = parser.load_modules()
+                parser = YangParser(yang_path)
+                modules = parser.load_modules()
+
+                load_time = time.time() - load_start
+                self.logger.info(
+                    "Loaded %d YANG modules in %.2fs", len(modules), load_time
+                )
 
-            load_time = time.time() - load_start
-            self.logger.info(f"Loaded {len(modules)} YANG modules in {load_time:.2f}s")
+                # Extract paths from modules
+                self.logger.info(
+                    "Extracting paths using %d concurrent workers...", workers
+                )
+                parse_start = time.time()
 
-            # Extract paths from modules
-            self.logger.info(f"Extracting paths using {workers} concurrent workers...")
-            parse_start = time.time()
+                path_catalog, list_registry = self._parse_modules_concurrent(
+                    modules, workers, yang_path
+                )
 
-            path_catalog, list_registry = self._parse_modules_concurrent(
-                modules, workers
-            )
+                parse_time = time.time() - parse_start
+                total_paths = sum(
+                    data["path_count"] for data in path_catalog.values()
+                )
 
-            parse_time = time.time() - parse_start
-            total_paths = sum(data["path_count"] for data in path_catalog.values())
+                self.logger.info(
+                    "Extracted %d paths from %d modules in %.2fs",
+                    total_paths,
+                    len(path_catalog),
+                    parse_time,
+                )
 
-            self.logger.info(
-                f"Extracted {total_paths} paths from {len(path_catalog)} modules in {parse_time:.2f}s"
-            )
+                self._store_catalog_cache(cache_key, path_catalog, list_registry)
 
             # Log statistics
-            self._log_parse_statistics(path_catalog)
+            self._log_parse_statistics(path_catalog, total_paths)
 
             # Store in datastore
             if store_in_datastore and total_paths > 0:
                 self.logger.info("Storing in datastore...")
                 key = f"device:{device_name}:yang_paths"
+                payload = _encode_payload(path_catalog)
                 self.action_service.set_value(
-                    key, json.dumps(path_catalog), ttl=None, encrypt=False
+                    key, payload, ttl=None, encrypt=False
                 )
-                self.logger.info(f"Stored in datastore with key: {key}")
+
+                # Version stamp lets downstream actions cache the decoded
+                # payload locally and skip the fetch when nothing changed
+                version = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+                self.action_service.set_value(
+                    f"device:{device_name}:yang_paths_version",
+                    version,
+                    ttl=None,
+                    encrypt=False,
+                )
+                self.logger.info("Stored in datastore with key: %s", key)
 
             # Store list registry in datastore
             if store_in_datastore and list_registry:
                 total_lists = sum(len(lists) for lists in list_registry.values())
                 self.logger.info(
-                    f"Storing {total_lists} lists from {len(list_registry)} modules..."
+                    "Storing %d lists from %d modules...",
+                    total_lists,
+                    len(list_registry),
                 )
                 key_lists = f"device:{device_name}:yang_lists"
                 self.action_service.set_value(
-                    key_lists, json.dumps(list_registry), ttl=None, encrypt=False
+                    key_lists, _encode_payload(list_registry), ttl=None, encrypt=False
                 )
-                self.logger.info(f"Stored list registry with key: {key_lists}")
+                self.logger.info("Stored list registry with key: %s", key_lists)
 
             # Summary
             total_time = time.time() - start_time
             self.logger.info(
-                f"Parsing complete: {len(path_catalog)} modules, "
-                f"{total_paths} paths, {total_time:.2f}s total"
+                "Parsing complete: %d modules, %d paths, %.2fs total",
+                len(path_catalog),
+                total_paths,
+                total_time,
             )
 
-            # Build result
-            sample_modules = self._build_sample_output(path_catalog)
+            # Build result - the sample walk is skipped entirely when the
+            # caller doesn't want it (e.g. workflow runs that only read
+            # the counters)
+            sample_modules = (
+                self._build_sample_output(path_catalog) if include_sample else []
+            )
 
             return (
                 True,
@@ -107,7 +250,7 @@ class YangParseModelsAction(Action):
 
         except FileNotFoundError as e:
             self.logger.error("YANG path not found")
-            self.logger.error(f"Error: {str(e)}")
+            self.logger.error("Error: %s", str(e))
             self.logger.error(
                 "Hint: Run yang_download_models first to download YANG files"
             )
@@ -122,7 +265,7 @@ class YangParseModelsAction(Action):
 
         except Exception as e:
             self.logger.error("YANG parsing failed")
-            self.logger.error(f"Error: {str(e)}")
+            self.logger.error("Error: %s", str(e))
             import traceback
 
             self.logger.error(traceback.format_exc())
@@ -135,16 +278,83 @@ class YangParseModelsAction(Action):
                 },
             )
 
-    def _parse_modules_concurrent(self, modules, workers):
+    @staticmethod
+    def _yang_dir_fingerprint(yang_path):
         """
-        Parse YANG modules concurrently using ThreadPoolExecutor
+        Fingerprint the .yang files in a directory for cache keying
 
-        Uses concurrent processing to speed up parsing of multiple modules.
-        Each module is parsed independently in its own thread.
+        Hashes the sorted (name, mtime_ns, size) triples. scandir hands
+        back the stat data the kernel already produced for the directory
+        scan, so no per-file stat syscalls are needed. Returns None when
+        the directory is missing or holds no .yang files, so those cases
+        fall through to the normal (error-raising) parse path.
+        """
+        triples = []
+        try:
+            with os.scandir(yang_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".yang") or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    triples.append((entry.name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            return None
+        if not triples:
+            return None
+        triples.sort()
+
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(b"v%d" % _CATALOG_CACHE_VERSION)
+        for name, mtime_ns, size in triples:
+            hasher.update(f"{name}\x00{mtime_ns}\x00{size}\x00".encode())
+        return hasher.hexdigest()
+
+    def _load_catalog_cache(self, cache_key):
+        """Return the cached (path_catalog, list_registry) pair, or None"""
+        if cache_key is None:
+            return None
+        cache_dir = get_cache_dir(_CATALOG_CACHE_SUBDIR)
+        if cache_dir is None:
+            return None
+        cache_file = os.path.join(cache_dir, f"{cache_key}.pkl")
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _store_catalog_cache(self, cache_key, path_catalog, list_registry):
+        """Atomically write the parsed catalog for this fingerprint"""
+        if cache_key is None:
+            return
+        cache_dir = get_cache_dir(_CATALOG_CACHE_SUBDIR)
+        if cache_dir is None:
+            return
+        try:
+            cache_file = os.path.join(cache_dir, f"{cache_key}.pkl")
+            tmp_file = f"{cache_file}.tmp.{os.getpid()}"
+            with open(tmp_file, "wb") as f:
+                pickle.dump((path_catalog, list_registry), f, protocol=5)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            # Cache is best-effort - a read-only /tmp must not fail the run
+            self.logger.warning("Could not write catalog cache: %s", str(e))
+
+    def _parse_modules_concurrent(self, modules, workers, yang_path):
+        """
+        Parse YANG modules concurrently using ProcessPoolExecutor
+
+        AST walking is CPU-bound pure Python, so a thread pool would
+        serialize on the GIL. Worker processes each load the pyang
+        context once (initializer) and then walk modules by name; the
+        results shipped back are plain dicts, which pickle cheaply.
+        Small module sets walk serially in-process - the per-worker
+        context load would cost more than it saves.
 
         Args:
             modules: Dict of {module_name: pyang_module}
-            workers: Number of concurrent worker threads
+            workers: Number of concurrent worker processes
+            yang_path: YANG directory, for the per-process context load
 
         Returns:
             tuple: (path_catalog, list_registry_all)
@@ -152,52 +362,81 @@ class YangParseModelsAction(Action):
                 - list_registry_all: Dict of {module_name: {list_path: metadata}}
         """
         path_catalog = {}
-        list_registry_all = {}  # NEW
+        list_registry_all = {}
+        total = len(modules)
 
-        def parse_module(module, module_name):
+        if workers <= 1 or total < 8:
             walker = ASTWalker()
-            paths = walker.extract_paths(module)
-            list_registry = walker.get_list_registry()
-            return (paths, list_registry)
-
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {
-                executor.submit(parse_module, module, module_name): module_name
-                for module_name, module in modules.items()
-            }
-
-            completed = 0
-            total = len(modules)
-
-            for future in as_completed(futures):
-                module_name = futures[future]
-                completed += 1
-
+            for module_name, module in modules.items():
                 try:
-                    paths, list_registry = future.result()
-                    if paths:
-                        path_catalog[module_name] = {
-                            "paths": paths,
-                            "path_count": len(paths),
-                        }
-
-                        if list_registry:
-                            list_registry_all[module_name] = list_registry
-
-                        if completed % 10 == 0:
-                            success_count = len(path_catalog)
-                            lists_count = len(list_registry_all)
-                            self.logger.info(
-                                f"Progress: {completed}/{total} modules "
-                                f"({success_count} with paths, {lists_count} with lists)"
-                            )
-
+                    walker.reset()
+                    paths = walker.extract_paths(module)
+                    self._collect_module_result(
+                        path_catalog, list_registry_all, module_name,
+                        paths, walker.get_list_registry(),
+                    )
                 except Exception as e:
-                    self.logger.warning(f"Failed to parse {module_name}: {str(e)}")
+                    self.logger.warning("Failed to parse %s: %s", module_name, str(e))
+            return path_catalog, list_registry_all
+
+        # Chunked map amortizes the pool's queue handoff and result
+        # pickling over batches of module names, instead of one future
+        # (and its bookkeeping) per module
+        chunksize = max(1, total // (workers * 4))
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_parse_worker,
+            initargs=(yang_path,),
+        ) as executor:
+            results = executor.map(_parse_one_module, modules, chunksize=chunksize)
+
+            for completed, (module_name, paths, list_registry, error) in enumerate(
+                results, 1
+            ):
+                if error is not None:
+                    self.logger.warning("Failed to parse %s: %s", module_name, error)
+                    continue
+
+                self._collect_module_result(
+                    path_catalog, list_registry_all, module_name,
+                    paths, list_registry,
+                )
+
+                if completed % 10 == 0:
+                    success_count = len(path_catalog)
+                    lists_count = len(list_registry_all)
+                    self.logger.info(
+                        "Progress: %d/%d modules (%d with paths, %d with lists)",
+                        completed,
+                        total,
+                        success_count,
+                        lists_count,
+                    )
 
         return path_catalog, list_registry_all
 
-    def _log_parse_statistics(self, path_catalog):
+    @staticmethod
+    def _collect_module_result(
+        path_catalog, list_registry_all, module_name, paths, list_registry
+    ):
+        """Fold one module's walk results into the shared catalogs"""
+        if paths:
+            # Re-intern type names on the parent side: pickling across the
+            # process boundary gives every pool chunk its own copies of
+            # the same few type strings
+            for info in paths.values():
+                type_name = info.get("type")
+                if type_name is not None:
+                    info["type"] = sys.intern(type_name)
+            path_catalog[module_name] = {
+                "paths": paths,
+                "path_count": len(paths),
+            }
+            if list_registry:
+                list_registry_all[module_name] = list_registry
+
+    def _log_parse_statistics(self, path_catalog, total_paths):
         """
         Log detailed statistics about parsed YANG data
 
@@ -210,60 +449,56 @@ class YangParseModelsAction(Action):
 
         Args:
             path_catalog: Dict of {module_name: {'paths': {...}, 'path_count': N}}
+            total_paths: Path total already computed by the caller
         """
 
-        # Count statistics
         total_modules = len(path_catalog)
-        total_paths = sum(data["path_count"] for data in path_catalog.values())
-
-        # Count config vs state paths
-        config_count = sum(
-            1
-            for mod_data in path_catalog.values()
-            for path_info in mod_data["paths"].values()
-            if path_info.get("config", True)
-        )
+
+        # Single fused pass over every path: the config/state split and
+        # the validation-metadata counts used to be four separate nested
+        # generator sweeps over the same dicts. The caller already knows
+        # the total, so the state count falls out by subtraction
+        config_count = enum_count = range_count = 0
+        for mod_data in path_catalog.values():
+            for path_info in mod_data["paths"].values():
+                if path_info.get("config", True):
+                    config_count += 1
+                if "enum" in path_info:
+                    enum_count += 1
+                if "range" in path_info:
+                    range_count += 1
         state_count = total_paths - config_count
 
         # Log statistics
         self.logger.info(
-            f"Statistics: {total_modules} modules, {total_paths} paths "
-            f"({config_count} config, {state_count} state)"
+            "Statistics: %d modules, %d paths (%d config, %d state)",
+            total_modules,
+            total_paths,
+            config_count,
+            state_count,
         )
 
         # Calculate average
         if total_modules > 0:
             avg_paths = total_paths / total_modules
-            self.logger.info(f"Average paths per module: {avg_paths:.1f}")
+            self.logger.info("Average paths per module: %.1f", avg_paths)
 
-        # Find and log top modules by path count
-        modules_by_path_count = sorted(
-            path_catalog.items(), key=lambda x: x[1]["path_count"], reverse=True
+        # Find and log top modules by path count - nlargest is
+        # O(N log 10) versus sorting the whole catalog for ten rows
+        top_modules = heapq.nlargest(
+            10, path_catalog.items(), key=lambda x: x[1]["path_count"]
         )
 
         self.logger.info("Top 10 modules by path count:")
-        for i, (module_name, data) in enumerate(modules_by_path_count[:10], 1):
+        for i, (module_name, data) in enumerate(top_modules, 1):
             self.logger.info(
-                f"  {i:2d}. {module_name:40s} - {data['path_count']:4d} paths"
+                "  %2d. %-40s - %4d paths", i, module_name, data["path_count"]
             )
 
         # Log paths with enums for validation features
-        enum_count = sum(
-            1
-            for mod_data in path_catalog.values()
-            for path_info in mod_data["paths"].values()
-            if "enum" in path_info
-        )
-        range_count = sum(
-            1
-            for mod_data in path_catalog.values()
-            for path_info in mod_data["paths"].values()
-            if "range" in path_info
-        )
-
         if enum_count > 0 or range_count > 0:
             self.logger.info(
-                f"Validation metadata: {enum_count} enums, {range_count} ranges"
+                "Validation metadata: %d enums, %d ranges", enum_count, range_count
             )
 
     def _build_sample_output(self, path_catalog):
@@ -291,10 +526,10 @@ class YangParseModelsAction(Action):
                 ]
         """
         sample_modules = []
-        for mod_name, mod_data in list(path_catalog.items())[:5]:
+        for mod_name, mod_data in islice(path_catalog.items(), 5):
             # Get sample paths
             sample_paths = []
-            for path, info in list(mod_data["paths"].items())[:5]:
+            for path, info in islice(mod_data["paths"].items(), 5):
                 sample_paths.append(
                     {
                         "path": path,